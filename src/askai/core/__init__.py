@@ -9,12 +9,17 @@ This package contains the main business logic components organized by functional
 - messaging: Message building utilities
 """
 
-from .ai import AIService, OpenRouterClient
+from typing import TYPE_CHECKING
+
 from .patterns import PatternManager, PatternConfiguration, PatternInput, PatternOutput
-from .questions import QuestionProcessor
 from .chat import ChatManager
 from .messaging import MessageBuilder
 
+if TYPE_CHECKING:
+    # Static definitions for type checkers and linters, resolved lazily by __getattr__
+    from .ai import AIService, OpenRouterClient
+    from .questions import QuestionProcessor
+
 __all__ = [
     'AIService',
     'OpenRouterClient',
@@ -26,3 +31,18 @@ __all__ = [
     'ChatManager',
     'MessageBuilder'
 ]
+
+
+def __getattr__(name):
+    """Import the HTTP-backed AI classes and the question processor on first access.
+
+    Importing any ``askai.core`` subpackage runs this module first, so eager
+    imports here would load the OpenRouter client for every command.
+    """
+    if name in ('AIService', 'OpenRouterClient'):
+        from . import ai  # pylint: disable=import-outside-toplevel
+        return getattr(ai, name)
+    if name == 'QuestionProcessor':
+        from .questions import QuestionProcessor  # pylint: disable=import-outside-toplevel
+        return QuestionProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
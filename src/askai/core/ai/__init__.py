@@ -4,9 +4,14 @@ AI service package for Ask AI.
 This package provides AI model integration services and client implementations
 for various AI providers, currently focusing on OpenRouter.
 """
+from typing import TYPE_CHECKING
+
 from .models import ModelConfiguration, ModelProvider, ModelConfigurationBuilder
-from .service import AIService
-from .openrouter import OpenRouterClient
+
+if TYPE_CHECKING:
+    # Static definitions for type checkers and linters, resolved lazily by __getattr__
+    from .openrouter import OpenRouterClient
+    from .service import AIService
 
 __all__ = [
     'AIService',
@@ -15,3 +20,18 @@ __all__ = [
     'ModelProvider',
     'ModelConfigurationBuilder'
 ]
+
+
+def __getattr__(name):
+    """Import the HTTP-backed service and client on first access.
+
+    Keeps ``import askai.core.ai.models`` (used by pattern parsing) from
+    pulling in the OpenRouter client and its ``requests`` dependency.
+    """
+    if name == 'OpenRouterClient':
+        from .openrouter import OpenRouterClient  # pylint: disable=import-outside-toplevel
+        return OpenRouterClient
+    if name == 'AIService':
+        from .service import AIService  # pylint: disable=import-outside-toplevel
+        return AIService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
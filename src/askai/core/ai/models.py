@@ -5,8 +5,11 @@ This module contains the classes needed to configure AI models,
 including provider definitions and model parameters.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any
 from enum import Enum
 
 
@@ -23,7 +26,27 @@ class ModelProvider(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+# Lookup table for resolving provider strings, built once at import time
+_PROVIDER_BY_STR: dict[str, ModelProvider] = {p.value.lower(): p for p in ModelProvider}
+
+# System-level fallback defaults, read-only so builders cannot alter them
+_SYSTEM_DEFAULTS = MappingProxyType({
+    'temperature': 0.7,
+    'max_tokens': None,
+    'web_search': False,
+    'web_search_context': 'medium',
+    'web_plugin': False,
+    'web_max_results': 5,
+})
+
+# Model settings that patterns and user arguments are allowed to override
+_OVERRIDE_KEYS = frozenset({
+    'temperature', 'max_tokens', 'web_search', 'web_search_context', 'web_plugin',
+    'web_max_results', 'web_search_prompt', 'stop_sequences', 'custom_parameters',
+})
+
+
+@dataclass(frozen=True, slots=True)
 class ModelConfiguration:  # pylint: disable=too-few-public-methods
     """
     Configuration for an AI model with customizable parameters.
@@ -32,6 +55,9 @@ class ModelConfiguration:  # pylint: disable=too-few-public-methods
     the provider, model name, and various generation parameters that control
     the behavior of the AI responses.
 
+    Instances are immutable and hashable, so they can be used as cache keys.
+    List-valued stop sequences are stored as tuples.
+
     Note: This is a pure data class. Default values should come from:
     1. Config file (config.yml) - user's global preferences
     2. Pattern file (pattern-specific overrides)
@@ -39,37 +65,70 @@ class ModelConfiguration:  # pylint: disable=too-few-public-methods
 
     Use ModelConfigurationBuilder to create instances with proper defaults.
     """
-    provider: Union[str, ModelProvider]
+    provider: ModelProvider  # provider strings are normalized in __post_init__
     model_name: str
-    temperature: Optional[float] = None
-    max_tokens: Optional[int] = None
-    stop_sequences: Optional[List[str]] = None
-    custom_parameters: Optional[Dict[str, Any]] = None
-    web_search: Optional[bool] = None
-    web_search_context: Optional[str] = None  # low, medium, high
-    web_plugin: Optional[bool] = None
-    web_max_results: Optional[int] = None
-    web_search_prompt: Optional[str] = None
+    temperature: float | None = None
+    max_tokens: int | None = None
+    stop_sequences: tuple[str, ...] | None = None
+    custom_parameters: dict[str, Any] | None = None
+    web_search: bool | None = None
+    web_search_context: str | None = None  # low, medium, high
+    web_plugin: bool | None = None
+    web_max_results: int | None = None
+    web_search_prompt: str | None = None
+    # Request payload settings and web request options, computed once in __post_init__
+    _request_settings: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _web_search_options: dict[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _web_plugin_config: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
-        """Convert provider to ModelProvider enum if it's a string."""
-        if hasattr(self.provider, 'value'):
-            provider_str = self.provider.value.lower()  # type: ignore
-        else:
-            provider_str = str(self.provider).lower()
-
-        try:
-            self.provider = ModelProvider(provider_str)
-        except ValueError:
-            for p in ModelProvider:
-                if p.value.lower() == provider_str:
-                    self.provider = p
-                    break
-            else:
-                self.provider = ModelProvider.OPENROUTER
+        """Normalize provider and stop sequences, then precompute request settings."""
+        if not isinstance(self.provider, ModelProvider):
+            # Unknown providers fall back to OpenRouter
+            object.__setattr__(
+                self, 'provider',
+                _PROVIDER_BY_STR.get(str(self.provider).lower(), ModelProvider.OPENROUTER)
+            )
+        if isinstance(self.stop_sequences, list):
+            object.__setattr__(self, 'stop_sequences', tuple(self.stop_sequences))
+
+        request_settings: dict[str, Any] = {"model": self.model_name}
+        if self.temperature is not None:
+            request_settings["temperature"] = self.temperature
+        if self.max_tokens is not None:
+            request_settings["max_tokens"] = self.max_tokens
+        if self.stop_sequences:
+            stop = self.stop_sequences
+            request_settings["stop"] = list(stop) if isinstance(stop, tuple) else stop
+        object.__setattr__(self, '_request_settings', request_settings)
+
+        if self.web_search:
+            object.__setattr__(
+                self, '_web_search_options',
+                {"search_context_size": self.web_search_context or "medium"}
+            )
+        if self.web_plugin:
+            web_plugin_config: dict[str, Any] = {"max_results": self.web_max_results or 5}
+            if self.web_search_prompt:
+                web_plugin_config["search_prompt"] = self.web_search_prompt
+            object.__setattr__(self, '_web_plugin_config', web_plugin_config)
+
+    def __hash__(self) -> int:
+        # custom_parameters may hold arbitrary nested data, so it only takes part in equality
+        return hash((
+            self.provider, self.model_name, self.temperature, self.max_tokens,
+            self.stop_sequences, self.web_search, self.web_search_context,
+            self.web_plugin, self.web_max_results, self.web_search_prompt,
+        ))
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ModelConfiguration':
+    def from_dict(cls, data: dict[str, Any]) -> ModelConfiguration:
         """
         Create a ModelConfiguration instance from a dictionary.
 
@@ -83,34 +142,26 @@ class ModelConfiguration:  # pylint: disable=too-few-public-methods
         Returns:
             ModelConfiguration instance with values from dictionary
         """
-        return cls(
-            provider=data.get('provider', 'openrouter'),
-            model_name=data.get('model_name', ''),
-            temperature=data.get('temperature'),
-            max_tokens=data.get('max_tokens'),
-            stop_sequences=data.get('stop_sequences'),
-            custom_parameters=data.get('custom_parameters'),
-            web_search=data.get('web_search'),
-            web_search_context=data.get('web_search_context'),
-            web_plugin=data.get('web_plugin'),
-            web_max_results=data.get('web_max_results'),
-            web_search_prompt=data.get('web_search_prompt')
-        )
+        kwargs = {key: data[key] for key in _FIELDS if key in data}
+        kwargs.setdefault('provider', 'openrouter')
+        kwargs.setdefault('model_name', '')
+        return cls(**kwargs)
+
+    def get_request_settings(self) -> dict[str, Any]:
+        """Get the model, temperature, max_tokens and stop payload fields."""
+        return self._request_settings
 
-    def get_web_search_options(self) -> Optional[Dict[str, str]]:
+    def get_web_search_options(self) -> dict[str, str] | None:
         """Get web search options for non-plugin search."""
-        if self.web_search:
-            return {"search_context_size": self.web_search_context or "medium"}
-        return None
+        return self._web_search_options
 
-    def get_web_plugin_config(self) -> Optional[Dict[str, Any]]:
+    def get_web_plugin_config(self) -> dict[str, Any] | None:
         """Get web plugin configuration."""
-        if self.web_plugin:
-            config: Dict[str, Any] = {"max_results": self.web_max_results or 5}
-            if self.web_search_prompt:
-                config["search_prompt"] = self.web_search_prompt
-            return config
-        return None
+        return self._web_plugin_config
+
+
+# Constructor arguments accepted by ModelConfiguration.from_dict
+_FIELDS = tuple(f.name for f in fields(ModelConfiguration) if f.init)
 
 
 class ModelConfigurationBuilder:
@@ -131,17 +182,15 @@ class ModelConfigurationBuilder:
         model_config = builder.build('openrouter', 'anthropic/claude-3.5-sonnet')
     """
 
+    __slots__ = ('config', '_values')
+
     # System-level fallback defaults (used when nothing else is specified)
-    SYSTEM_DEFAULTS = {
-        'temperature': 0.7,
-        'max_tokens': None,
-        'web_search': False,
-        'web_search_context': 'medium',
-        'web_plugin': False,
-        'web_max_results': 5,
-    }
-
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    SYSTEM_DEFAULTS = _SYSTEM_DEFAULTS
+
+    # Every overridable setting pre-seeded as unset, so _values never has to grow
+    _EMPTY_VALUES: dict[str, Any] = dict.fromkeys(_OVERRIDE_KEYS)
+
+    def __init__(self, config: dict[str, Any] | None = None):
         """
         Initialize the builder with config file defaults.
 
@@ -149,31 +198,33 @@ class ModelConfigurationBuilder:
             config: Configuration dictionary from config.yml
         """
         self.config = config or {}
-        self._values: Dict[str, Any] = {}
+        self._values: dict[str, Any] = self._EMPTY_VALUES.copy()
 
-    def from_config_defaults(self) -> 'ModelConfigurationBuilder':
+    def from_config_defaults(self) -> ModelConfigurationBuilder:
         """
         Apply defaults from config file.
 
         Returns:
             Self for method chaining
         """
+        config = self.config
+        defaults = _SYSTEM_DEFAULTS
         # Get web search config
-        web_search_config = self.config.get('web_search', {})
+        web_search_config = config.get('web_search', {})
 
         self._values.update({
-            'temperature': self.config.get('temperature', self.SYSTEM_DEFAULTS['temperature']),
-            'max_tokens': self.config.get('max_tokens', self.SYSTEM_DEFAULTS['max_tokens']),
+            'temperature': config.get('temperature', defaults['temperature']),
+            'max_tokens': config.get('max_tokens', defaults['max_tokens']),
             # Note: Don't set web_search or web_plugin from global 'enabled' - that only
             # configures availability. Web search should only be enabled when explicitly
             # requested (e.g., enable_url_search=True or pattern/CLI override)
-            'web_search': web_search_config.get('false', self.SYSTEM_DEFAULTS['web_search']),
-            'web_search_context': self.SYSTEM_DEFAULTS['web_search_context'],
-            'web_max_results': web_search_config.get('max_results', self.SYSTEM_DEFAULTS['web_max_results']),
+            'web_search': web_search_config.get('false', defaults['web_search']),
+            'web_search_context': defaults['web_search_context'],
+            'web_max_results': web_search_config.get('max_results', defaults['web_max_results']),
         })
         return self
 
-    def from_pattern(self, pattern_config: Optional[Dict[str, Any]]) -> 'ModelConfigurationBuilder':
+    def from_pattern(self, pattern_config: dict[str, Any] | None) -> ModelConfigurationBuilder:
         """
         Apply overrides from pattern configuration.
 
@@ -187,28 +238,11 @@ class ModelConfigurationBuilder:
             return self
 
         # Only override values that are explicitly set in the pattern
-        if 'temperature' in pattern_config:
-            self._values['temperature'] = pattern_config['temperature']
-        if 'max_tokens' in pattern_config:
-            self._values['max_tokens'] = pattern_config['max_tokens']
-        if 'stop_sequences' in pattern_config:
-            self._values['stop_sequences'] = pattern_config['stop_sequences']
-        if 'custom_parameters' in pattern_config:
-            self._values['custom_parameters'] = pattern_config['custom_parameters']
-        if 'web_search' in pattern_config:
-            self._values['web_search'] = pattern_config['web_search']
-        if 'web_search_context' in pattern_config:
-            self._values['web_search_context'] = pattern_config['web_search_context']
-        if 'web_plugin' in pattern_config:
-            self._values['web_plugin'] = pattern_config['web_plugin']
-        if 'web_max_results' in pattern_config:
-            self._values['web_max_results'] = pattern_config['web_max_results']
-        if 'web_search_prompt' in pattern_config:
-            self._values['web_search_prompt'] = pattern_config['web_search_prompt']
+        self._values.update({key: pattern_config[key] for key in pattern_config.keys() & _OVERRIDE_KEYS})
 
         return self
 
-    def from_user_args(self, **kwargs: Any) -> 'ModelConfigurationBuilder':
+    def from_user_args(self, **kwargs: Any) -> ModelConfigurationBuilder:
         """
         Apply overrides from user arguments (CLI or API).
 
@@ -220,15 +254,12 @@ class ModelConfigurationBuilder:
             Self for method chaining
         """
         for key, value in kwargs.items():
-            if value is not None and key in ['temperature', 'max_tokens', 'web_search',
-                                              'web_search_context', 'web_plugin',
-                                              'web_max_results', 'web_search_prompt',
-                                              'stop_sequences', 'custom_parameters']:
+            if value is not None and key in _OVERRIDE_KEYS:
                 self._values[key] = value
 
         return self
 
-    def build(self, provider: Union[str, ModelProvider], model_name: str) -> ModelConfiguration:
+    def build(self, provider: str | ModelProvider, model_name: str) -> ModelConfiguration:
         """
         Build the final ModelConfiguration instance.
 
@@ -15,9 +15,35 @@ from typing import List, Dict, Any, Optional, Callable
 
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from askai.utils import json_loads
 from askai.utils import load_config
 from askai.utils import setup_logger
 from askai.utils import print_error_or_warnings
+from .models import ModelConfiguration
+
+
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which the stdlib encoder handles
+    return json.dumps(payload).encode('utf-8')
+
+
+def _decode_response(response: requests.Response) -> Any:
+    """Parse a JSON response body with json_loads, which keeps integers wider than 64 bits exact."""
+    try:
+        return json_loads(response.content)
+    except ValueError:
+        pass  # let requests report the error (or handle a non UTF-8 body)
+    return response.json()
 
 
 class OpenRouterClient:
@@ -38,6 +64,13 @@ class OpenRouterClient:
         if not self.base_url.endswith('/'):
             self.base_url += '/'
 
+        # Shared session so repeated calls on this client reuse the HTTP(S) connection
+        self._session = requests.Session()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
     def _get_headers(self):
         """Get the common headers for API requests."""
         return {
@@ -61,6 +94,10 @@ class OpenRouterClient:
         Returns:
             Updated payload with model settings
         """
+        if isinstance(model_config, ModelConfiguration):
+            payload.update(model_config.get_request_settings())
+            return payload
+
         payload["model"] = model_config.model_name
         if model_config.temperature is not None:
             payload["temperature"] = model_config.temperature
@@ -289,7 +326,7 @@ class OpenRouterClient:
             dict: The extracted data or error response
         """
         if response.ok:
-            response_data = response.json()
+            response_data = _decode_response(response)
 
             # Check if response has choices (normal response) or error (API error with 200 status)
             if "choices" in response_data:
@@ -480,7 +517,10 @@ class OpenRouterClient:
 
         # Step 9: Make the API request and handle response
         try:
-            response = requests.post(f"{self.base_url}chat/completions", headers=headers, json=payload, timeout=30)
+            # The payload carries inline images/PDFs, so serialize it here rather than via requests' json=
+            response = self._session.post(
+                f"{self.base_url}chat/completions", headers=headers, data=_encode_payload(payload), timeout=30
+            )
             return self._handle_api_response(response, logger, content_info)
         except requests.exceptions.ConnectionError as e:
             logger.critical(json.dumps({
@@ -549,9 +589,9 @@ class OpenRouterClient:
 
         try:
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self._session.get(url, headers=headers, timeout=30)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=data, timeout=30)
+                response = self._session.post(url, headers=headers, json=data, timeout=30)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -3,10 +3,13 @@ AI interaction and model configuration handling.
 Manages AI response generation and model configuration logic.
 """
 
-import json
+from __future__ import annotations
+
+import logging
 import threading
-from typing import Any, Dict, List, Optional
-from askai.utils import tqdm_spinner, load_config
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any
+from askai.utils import tqdm_spinner, load_config, log_json
 from .models import ModelConfiguration, ModelProvider, ModelConfigurationBuilder
 from .openrouter import OpenRouterClient
 
@@ -17,12 +20,43 @@ class AIService:
 
     def __init__(self, logger):
         self.logger = logger
+        # Single long-lived worker for the progress spinner, reused across requests
+        self._spinner_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="askai-spin")
+        # Model configurations built from config + CLI model only, keyed by model name.
+        # Valid for as long as load_config() keeps handing out the same config object.
+        self._model_config_source: dict[str, Any] | None = None
+        self._model_config_cache: dict[str | None, ModelConfiguration] = {}
+        # OpenRouter client reused across requests while the config object stays the same
+        self._client: OpenRouterClient | None = None
+        self._client_config: dict[str, Any] | None = None
+
+    def close(self) -> None:
+        """Shut down the spinner worker thread and the pooled OpenRouter client.
+
+        Owners call this when the service's lifetime ends: per request in the
+        API routes, and through QuestionProcessor.close/PatternProcessor.close
+        for the CLI and the TUI.
+        """
+        self._spinner_pool.shutdown(wait=True)
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            self._client_config = None
+
+    def _get_client(self, config: dict[str, Any]) -> OpenRouterClient:
+        """Return the pooled OpenRouter client, recreating it when the config changes."""
+        if self._client is None or self._client_config is not config:
+            if self._client is not None:
+                self._client.close()
+            self._client = OpenRouterClient(config=config, logger=self.logger)
+            self._client_config = config
+        return self._client
 
     def get_model_configuration(
         self,
-        model_name: Optional[str],
-        config: Dict[str, Any],
-        pattern_data: Optional[Dict[str, Any]] = None
+        model_name: str | None,
+        config: dict[str, Any],
+        pattern_data: dict[str, Any] | None = None
     ) -> ModelConfiguration:
         """Get model configuration based on priority: Config > Pattern > CLI args.
 
@@ -39,6 +73,29 @@ class AIService:
         Returns:
             The configured ModelConfiguration instance
         """
+        # Pattern data is re-read on every call, so only the config-only path is memoized
+        if not pattern_data:
+            if self._model_config_source is not config:
+                self._model_config_cache.clear()
+                self._model_config_source = config
+            cached = self._model_config_cache.get(model_name)
+            if cached is not None:
+                # Same log output as the uncached path, independent of cache state
+                self._log_model_selection(model_name, cached)
+                return cached
+            model_config = self._build_model_configuration(model_name, config, None)
+            self._model_config_cache[model_name] = model_config
+            return model_config
+
+        return self._build_model_configuration(model_name, config, pattern_data)
+
+    def _build_model_configuration(
+        self,
+        model_name: str | None,
+        config: dict[str, Any],
+        pattern_data: dict[str, Any] | None
+    ) -> ModelConfiguration:
+        """Build a fresh ModelConfiguration, see get_model_configuration."""
         # Start with config file defaults
         builder = ModelConfigurationBuilder(config).from_config_defaults()
 
@@ -54,11 +111,11 @@ class AIService:
                 # Check if we have a pre-built ModelConfiguration object
                 if hasattr(pattern_config, 'model') and pattern_config.model:
                     model_config = pattern_config.model
-                    self.logger.info(json.dumps({
-                        "log_message": "Using model configuration from pattern",
-                        "model_name": model_config.model_name,
-                        "provider": model_config.provider.value if model_config.provider else 'openrouter'
-                    }))
+                    log_json(
+                        self.logger, logging.INFO, "Using model configuration from pattern",
+                        model_name=model_config.model_name,
+                        provider=model_config.provider.value
+                    )
                     return model_config
 
                 # Handle dictionary format with pattern overrides
@@ -72,48 +129,45 @@ class AIService:
                                 provider = model_data['provider']
                             if 'model_name' in model_data:
                                 final_model_name = model_data['model_name']
-                            self.logger.info("Applied model configuration from pattern dict")
+                            log_json(self.logger, logging.INFO, "Applied model configuration from pattern dict")
 
         # Priority 2: Explicit model name from CLI
         if model_name:
             final_model_name = model_name
-            self.logger.info(json.dumps({
-                "log_message": "Using explicit model from CLI",
-                "model": model_name
-            }))
 
         # Build the final configuration
         model_config = builder.build(provider=provider, model_name=final_model_name)
+        self._log_model_selection(model_name, model_config)
+        return model_config
 
-        # Get provider value for logging
-        provider_value = (
-            model_config.provider.value
-            if isinstance(model_config.provider, ModelProvider)
-            else str(model_config.provider)
-        )
-
-        self.logger.info(json.dumps({
-            "log_message": "Built model configuration",
-            "model_name": model_config.model_name,
-            "provider": provider_value,
-            "temperature": model_config.temperature,
-            "max_tokens": model_config.max_tokens,
-            "web_search": model_config.web_search,
-            "web_plugin": model_config.web_plugin
-        }))
+    def _log_model_selection(self, model_name: str | None, model_config: ModelConfiguration) -> None:
+        """Log which model a config/CLI based configuration selected."""
+        # Skip assembling the log fields entirely when INFO is disabled
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
 
-        return model_config
+        if model_name:
+            log_json(self.logger, logging.INFO, "Using explicit model from CLI", model=model_name)
+        log_json(
+            self.logger, logging.INFO, "Built model configuration",
+            model_name=model_config.model_name,
+            provider=model_config.provider.value,
+            temperature=model_config.temperature,
+            max_tokens=model_config.max_tokens,
+            web_search=model_config.web_search,
+            web_plugin=model_config.web_plugin
+        )
 
     def get_ai_response(
         self,
-        messages: List[Dict[str, Any]],
-        model_name: Optional[str] = None,
+        messages: list[dict[str, Any]],
+        model_name: str | None = None,
         *,
-        pattern_id: Optional[str] = None,
+        pattern_id: str | None = None,
         debug: bool = False,
         pattern_manager: Any = None,
         enable_url_search: bool = False
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         # pylint: disable=too-many-locals
         """Get response from AI model with progress spinner.
 
@@ -129,11 +183,10 @@ class AIService:
             Response dictionary from the AI model
         """
         stop_spinner = threading.Event()
-        spinner = threading.Thread(target=tqdm_spinner, args=(stop_spinner,))
-        spinner.start()
+        spinner = self._spinner_pool.submit(tqdm_spinner, stop_spinner)
 
         try:
-            self.logger.info(json.dumps({"log_message": "Messages sending to ai"}))
+            log_json(self.logger, logging.INFO, "Messages sending to ai")
 
             # Get configuration from the proper source
             config = load_config()
@@ -147,15 +200,9 @@ class AIService:
             model_config = self.get_model_configuration(model_name, config, pattern_data)
 
             # Determine web search configuration
-            web_search_options = None
-            web_plugin_config = None
-
             # Priority 1: System-specific web search configuration
-            if hasattr(model_config, 'get_web_search_options'):
-                web_search_options = model_config.get_web_search_options()
-
-            if hasattr(model_config, 'get_web_plugin_config'):
-                web_plugin_config = model_config.get_web_plugin_config()
+            web_search_options = model_config.get_web_search_options()
+            web_plugin_config = model_config.get_web_plugin_config()
 
             # Priority 2: Global configuration or URL search override
             if web_search_options is None and web_plugin_config is None:
@@ -175,8 +222,8 @@ class AIService:
                             "search_context_size": web_config.get('context_size', 'medium')
                         }
 
-            # Create OpenRouter client and get response
-            openrouter_client = OpenRouterClient(config=config, logger=self.logger)
+            # Get the (pooled) OpenRouter client and request the response
+            openrouter_client = self._get_client(config)
             response = openrouter_client.request_completion(
                 messages=messages,
                 model_config=model_config,
@@ -185,12 +232,11 @@ class AIService:
                 web_plugin_config=web_plugin_config
             )
 
-            self.logger.debug(json.dumps({
-                "log_message": "Response from ai",
-                "response": str(response)
-            }))
-            self.logger.info(json.dumps({"log_message": "Response received from ai"}))
+            # Stringifying the full response is expensive, only do it when debug is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                log_json(self.logger, logging.DEBUG, "Response from ai", response=str(response))
+            log_json(self.logger, logging.INFO, "Response received from ai")
             return response
         finally:
             stop_spinner.set()
-            spinner.join()
+            wait((spinner,))
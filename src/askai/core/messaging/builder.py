@@ -4,10 +4,13 @@ Handles construction of messages for AI interaction based on various inputs.
 """
 
 import json
+import logging
 import os
+import queue
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 from askai.utils import (get_piped_input, get_file_input, build_format_instruction,
-                   encode_file_to_base64, generate_output_format_template)
+                   encode_file_to_data_uri, generate_output_format_template, log_json)
 from askai.utils.helpers import fetch_url_content
 
 
@@ -25,6 +28,40 @@ MIME_TYPE_MAP = {
     "bmp": "bmp"
 }
 
+# Same mapping keyed by dotted suffix in lower and upper case, for lookups without splitext
+_MIME_TYPE_BY_SUFFIX = {
+    f".{case(ext)}": mime_type
+    for ext, mime_type in MIME_TYPE_MAP.items()
+    for case in (str.lower, str.upper)
+}
+
+
+# Attachment values that are already URLs (remote or data URIs) and are sent as-is
+_URL_PREFIXES = ('http://', 'https://', 'data:')
+
+
+def _has_pdf_suffix(name: str) -> bool:
+    """Check for a '.pdf' suffix (any case) by comparing only the last four characters."""
+    return name[-4:].lower() == ".pdf"
+
+
+def _multimodal_user_message(question: str, attachment_part: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a question and one attachment content part into a user message."""
+    return {
+        "role": "user",
+        "content": [{"type": "text", "text": question}, attachment_part]
+    }
+
+
+def _run_prefetch_task(results: queue.Queue, name: str, func: Any, *args: Any) -> None:
+    """Run one input task on a worker thread and report (name, error, value) to the queue."""
+    try:
+        results.put((name, None, func(*args)))
+    except BaseException as e:  # pylint: disable=broad-exception-caught
+        # Includes the SystemExit raised by print_error_or_warnings, which the
+        # caller re-raises on the main thread
+        results.put((name, e, None))
+
 
 class MessageBuilder:
     """Builds messages for AI interaction from various input sources."""
@@ -38,6 +75,10 @@ class MessageBuilder:
         """
         self.pattern_manager = pattern_manager
         self.logger = logger
+        # Data URIs encoded during the current build_messages call, keyed on
+        # (path, media type, mtime, size). Cleared when the call returns so
+        # large encodings are not kept alive between requests.
+        self._encodings: Dict[Tuple[str, str, int, int], Optional[str]] = {}
 
     # ========================================================================
     # HELPER METHODS
@@ -52,8 +93,94 @@ class MessageBuilder:
         Returns:
             MIME type string (defaults to 'jpeg' if unknown)
         """
-        file_ext = os.path.splitext(file_path)[1].lower().replace(".", "")
-        return MIME_TYPE_MAP.get(file_ext or "jpeg", "jpeg")
+        suffix = file_path[file_path.rfind("."):]
+        mime_type = _MIME_TYPE_BY_SUFFIX.get(suffix)
+        if mime_type is None:
+            # Mixed-case extensions are rare, normalize only when the direct hit fails
+            mime_type = _MIME_TYPE_BY_SUFFIX.get(suffix.lower(), "jpeg")
+        return mime_type
+
+    def _encoded_bytes(self, file_path: str, media_type: str) -> Optional[str]:
+        """Get a file as a base64 data URI, reusing earlier encodings of the same file.
+
+        Args:
+            file_path: Path to the file
+            media_type: Media type of the data URI (e.g., 'image/png')
+
+        Returns:
+            The data URI, or None if the file could not be read
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            # Let the uncached path report the error
+            return encode_file_to_data_uri(file_path, media_type)
+        key = (file_path, media_type, stat.st_mtime_ns, stat.st_size)
+        if key not in self._encodings:
+            self._encodings[key] = encode_file_to_data_uri(file_path, media_type)
+        return self._encodings[key]
+
+    def _warm_encoding(self, file_path: str, media_type: str) -> None:
+        """Populate the encoding cache for a file, leaving error reporting to the real call."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return
+        key = (file_path, media_type, stat.st_mtime_ns, stat.st_size)
+        self._encodings[key] = encode_file_to_data_uri(file_path, media_type)
+
+    def _prefetch_inputs(
+        self,
+        *,
+        file_input: Optional[str],
+        url: Optional[str],
+        image: Optional[str],
+        pdf: Optional[str]
+    ) -> Dict[str, Any]:
+        """Read, fetch and encode independent inputs, concurrently when there are several.
+
+        Args:
+            file_input: Optional path to input file
+            url: Optional URL to fetch
+            image: Optional path to image file
+            pdf: Optional path to PDF file
+
+        Returns:
+            Dictionary with the file content under 'file_input' and the
+            (content, error) fetch result under 'url'. Image and PDF encodings
+            are placed in the encoding cache and picked up by the encode helpers.
+        """
+        tasks: Dict[str, Tuple[Any, ...]] = {}
+        if file_input:
+            tasks['file_input'] = (get_file_input, file_input)
+        if url:
+            tasks['url'] = (fetch_url_content, url)
+        if image:
+            tasks['image'] = (self._warm_encoding, image, f"image/{self._get_mime_type(image)}")
+        if pdf and _has_pdf_suffix(pdf):
+            tasks['pdf'] = (self._warm_encoding, pdf, "application/pdf")
+
+        if len(tasks) < 2:
+            # Nothing to overlap
+            return {name: func(*args) for name, (func, *args) in tasks.items()}
+
+        # Daemon threads rather than an executor: when an input fails (the readers
+        # call sys.exit after reporting the error) the failure is re-raised right
+        # away, without waiting for a slow URL fetch or being joined at exit
+        results: queue.Queue = queue.Queue()
+        for name, (func, *args) in tasks.items():
+            threading.Thread(
+                target=_run_prefetch_task, args=(results, name, func, *args),
+                name=f"askai-input-{name}", daemon=True
+            ).start()
+
+        prefetched = {}
+        for _ in tasks:
+            name, error, value = results.get()
+            if error is not None:
+                raise error
+            prefetched[name] = value
+        return prefetched
 
     def _create_image_multimodal_message(
         self,
@@ -65,28 +192,22 @@ class MessageBuilder:
 
         Args:
             question: User question about the image
-            image_data: Base64-encoded image data or URL
+            image_data: Base64-encoded image data, data URI or URL
             mime_type: MIME type (e.g., 'jpeg', 'png')
 
         Returns:
             Message dictionary with multimodal content
         """
-        # Check if it's a URL or base64 data
-        if image_data.startswith(('http://', 'https://')):
+        # Check if it's a URL/data URI or bare base64 data
+        if image_data.startswith(_URL_PREFIXES):
             image_url = image_data
         else:
-            image_url = f"data:image/{mime_type};base64,{image_data}"
-
-        return {
-            "role": "user",
-            "content": [
-                {"type": "text", "text": question},
-                {
-                    "type": "image_url",
-                    "image_url": {"url": image_url}
-                }
-            ]
-        }
+            image_url = "".join(("data:image/", mime_type, ";base64,", image_data))
+
+        return _multimodal_user_message(question, {
+            "type": "image_url",
+            "image_url": {"url": image_url}
+        })
 
     def _create_pdf_multimodal_message(
         self,
@@ -98,31 +219,25 @@ class MessageBuilder:
 
         Args:
             question: User question about the PDF
-            pdf_data: Base64-encoded PDF data or URL
+            pdf_data: Base64-encoded PDF data, data URI or URL
             filename: PDF filename
 
         Returns:
             Message dictionary with multimodal content
         """
-        # Check if it's a URL or base64 data
-        if pdf_data.startswith(('http://', 'https://')):
+        # Check if it's a URL/data URI or bare base64 data
+        if pdf_data.startswith(_URL_PREFIXES):
             file_data = pdf_data
         else:
-            file_data = f"data:application/pdf;base64,{pdf_data}"
-
-        return {
-            "role": "user",
-            "content": [
-                {"type": "text", "text": question},
-                {
-                    "type": "file",
-                    "file": {
-                        "filename": filename,
-                        "file_data": file_data
-                    }
-                }
-            ]
-        }
+            file_data = "".join(("data:application/pdf;base64,", pdf_data))
+
+        return _multimodal_user_message(question, {
+            "type": "file",
+            "file": {
+                "filename": filename,
+                "file_data": file_data
+            }
+        })
 
     def _encode_image_file(
         self,
@@ -140,23 +255,17 @@ class MessageBuilder:
         Returns:
             None if question was consumed, original question otherwise
         """
-        self.logger.info(json.dumps({
-            "log_message": "Processing image file",
-            "image_path": image_path
-        }))
+        log_json(self.logger, logging.INFO, "Processing image file", image_path=image_path)
 
         mime_type = self._get_mime_type(image_path)
-        image_base64 = encode_file_to_base64(image_path)
+        image_data_uri = self._encoded_bytes(image_path, f"image/{mime_type}")
 
-        if image_base64:
+        if image_data_uri:
             user_question = question or "Please analyze and describe this image in detail."
-            message = self._create_image_multimodal_message(user_question, image_base64, mime_type)
+            message = self._create_image_multimodal_message(user_question, image_data_uri, mime_type)
             messages.append(message)
 
-            self.logger.debug(json.dumps({
-                "log_message": "Created multimodal message for image",
-                "mime_type": mime_type
-            }))
+            log_json(self.logger, logging.DEBUG, "Created multimodal message for image", mime_type=mime_type)
             return None  # Question consumed
 
         return question
@@ -177,73 +286,61 @@ class MessageBuilder:
         Returns:
             None if question was consumed, original question otherwise
         """
-        pdf_filename = os.path.basename(pdf_path)
-        file_ext = os.path.splitext(pdf_filename)[1].lower()
+        # The suffix of the full path is the suffix of its basename
+        is_pdf = _has_pdf_suffix(pdf_path)
 
-        self.logger.debug(json.dumps({
-            "log_message": "Processing PDF file",
-            "pdf_path": pdf_path,
-            "extension": file_ext
-        }))
+        log_json(self.logger, logging.DEBUG, "Processing PDF file", pdf_path=pdf_path, is_pdf=is_pdf)
 
         # Handle non-PDF files as text
-        if file_ext != '.pdf':
-            self.logger.warning(json.dumps({
-                "log_message": "File does not have .pdf extension, treating as text file",
-                "file_path": pdf_path
-            }))
+        if not is_pdf:
+            log_json(
+                self.logger, logging.WARNING, "File does not have .pdf extension, treating as text file",
+                file_path=pdf_path
+            )
 
             file_content = get_file_input(pdf_path)
             if file_content:
                 messages.append({
                     "role": "system",
-                    "content": f"The file content of {pdf_filename} to work with:\n{file_content}"
+                    "content": f"The file content of {os.path.basename(pdf_path)} to work with:\n{file_content}"
                 })
                 return question or "Please analyze and summarize the content of this file."
             return question
 
         # Encode actual PDF file
-        pdf_base64 = encode_file_to_base64(pdf_path)
-        if not pdf_base64:
-            self.logger.warning("Failed to encode PDF file")
+        pdf_data_uri = self._encoded_bytes(pdf_path, "application/pdf")
+        if not pdf_data_uri:
+            log_json(self.logger, logging.WARNING, "Failed to encode PDF file")
             return question
 
         user_question = question or "Please analyze and summarize the content of this PDF."
+        pdf_filename = os.path.basename(pdf_path)
 
         try:
-            message = self._create_pdf_multimodal_message(user_question, pdf_base64, pdf_filename)
-            messages.append(message)
-
-            # Add fallback note
-            messages.append({
+            message = self._create_pdf_multimodal_message(user_question, pdf_data_uri, pdf_filename)
+            # Message plus fallback note, added in one step
+            messages.extend((message, {
                 "role": "system",
                 "content": ("Note: If you're unable to access the PDF content directly, "
                           "please inform the user that the PDF could not be processed, "
                           "and ask them to try extracting the text manually.")
-            })
-
-            self.logger.debug(json.dumps({
-                "log_message": "Created multimodal message for PDF",
-                "filename": pdf_filename
             }))
+
+            log_json(self.logger, logging.DEBUG, "Created multimodal message for PDF", filename=pdf_filename)
             return None  # Question consumed
 
         except Exception as e:
-            self.logger.error(json.dumps({
-                "log_message": "Error creating PDF message format",
-                "error": str(e)
-            }))
+            log_json(self.logger, logging.ERROR, "Error creating PDF message format", error=str(e))
 
-            messages.append({
+            messages.extend(({
                 "role": "user",
                 "content": user_question
-            })
-            messages.append({
+            }, {
                 "role": "system",
                 "content": (f"The user attempted to upload a PDF file named '{pdf_filename}', "
                           f"but it couldn't be processed. Please inform them that PDF processing "
                           f"may require PyPDF2 to be installed or the PDF may not be compatible.")
-            })
+            }))
             return None  # Question consumed
 
     # ========================================================================
@@ -289,154 +386,137 @@ class MessageBuilder:
 
         # Handle piped input from terminal
         if context := get_piped_input():
-            self.logger.info(json.dumps({"log_message": "Piped input received"}))
+            log_json(self.logger, logging.INFO, "Piped input received")
             messages.append({
                 "role": "system",
                 "content": f"Previous terminal output:\n{context}"
             })
 
-        # Handle input file content
-        if file_input and (file_content := get_file_input(file_input)):
-            self.logger.info(json.dumps({
-                "log_message": "Input file read successfully",
-                "file_path": file_input
-            }))
-            messages.append({
-                "role": "system",
-                "content": f"The file content of {file_input} to work with:\n{file_content}"
-            })
-
-        # Handle URL input - fetch content and add to messages
-        if url:
-            self.logger.info(json.dumps({
-                "log_message": "URL provided for analysis",
-                "url": url
-            }))
-
-            url_content, error = fetch_url_content(url)
+        try:
+            # Disk reads, URL fetching and base64 encoding are independent of each other
+            prefetched = self._prefetch_inputs(file_input=file_input, url=url, image=image, pdf=pdf)
 
-            if url_content:
-                self.logger.info(json.dumps({
-                    "log_message": "URL content fetched successfully",
-                    "content_length": len(url_content)
-                }))
+            # Handle input file content
+            if file_input and (file_content := prefetched['file_input']):
+                log_json(self.logger, logging.INFO, "Input file read successfully", file_path=file_input)
                 messages.append({
                     "role": "system",
-                    "content": f"The content from URL {url}:\n{url_content}"
+                    "content": f"The file content of {file_input} to work with:\n{file_content}"
                 })
-                # If no question provided, default to summarization
-                if not question:
-                    question = "Please analyze and summarize the content from the provided URL"
-            else:
-                self.logger.error(json.dumps({
-                    "log_message": "Failed to fetch URL content",
-                    "url": url,
-                    "error": error
-                }))
-                # Fallback to asking AI to reason about the URL
-                if not question:
-                    question = (f"Please analyze and summarize what you know about this URL: {url} "
-                              f"(Note: Content could not be fetched due to: {error})")
+
+            # Handle URL input - fetch content and add to messages
+            if url:
+                log_json(self.logger, logging.INFO, "URL provided for analysis", url=url)
+
+                url_content, error = prefetched['url']
+
+                if url_content:
+                    log_json(
+                        self.logger, logging.INFO, "URL content fetched successfully",
+                        content_length=len(url_content)
+                    )
+                    messages.append({
+                        "role": "system",
+                        "content": f"The content from URL {url}:\n{url_content}"
+                    })
+                    # If no question provided, default to summarization
+                    if not question:
+                        question = "Please analyze and summarize the content from the provided URL"
                 else:
-                    question = (f"Please analyze this URL: {url} "
-                              f"(Note: Content could not be fetched due to: {error})\n\n"
-                              f"Question: {question}")
+                    log_json(self.logger, logging.ERROR, "Failed to fetch URL content", url=url, error=error)
+                    # Fallback to asking AI to reason about the URL
+                    if not question:
+                        question = (f"Please analyze and summarize what you know about this URL: {url} "
+                                  f"(Note: Content could not be fetched due to: {error})")
+                    else:
+                        question = (f"Please analyze this URL: {url} "
+                                  f"(Note: Content could not be fetched due to: {error})\n\n"
+                                  f"Question: {question}")
+
+            # Handle image input - convert to base64 for multimodal message
+            if image:
+                question = self._encode_image_file(image, question, messages)
+
+            # Handle image URL input
+            if image_url:
+                log_json(self.logger, logging.INFO, "Image URL provided for analysis", image_url=image_url)
+
+                user_question = question or "Please analyze and describe this image in detail."
+                message = self._create_image_multimodal_message(user_question, image_url, "jpeg")
+                messages.append(message)
+                question = None  # Mark question as consumed
 
-        # Handle image input - convert to base64 for multimodal message
-        if image:
-            question = self._encode_image_file(image, question, messages)
+                log_json(self.logger, logging.DEBUG, "Created multimodal message for image URL")
 
-        # Handle image URL input
-        if image_url:
-            self.logger.info(json.dumps({
-                "log_message": "Image URL provided for analysis",
-                "image_url": image_url
-            }))
+            # Handle PDF input - encode as base64
+            if pdf:
+                question = self._encode_pdf_file(pdf, question, messages)
 
-            user_question = question or "Please analyze and describe this image in detail."
-            message = self._create_image_multimodal_message(user_question, image_url, "jpeg")
-            messages.append(message)
-            question = None  # Mark question as consumed
+            # Handle PDF URL input
+            if pdf_url:
+                log_json(self.logger, logging.INFO, "PDF URL provided for analysis", pdf_url=pdf_url)
 
-            self.logger.debug(json.dumps({
-                "log_message": "Created multimodal message for image URL"
-            }))
+                # Extract filename from URL
+                pdf_filename = pdf_url.rsplit('/', 1)[-1]
+                if not _has_pdf_suffix(pdf_filename):
+                    pdf_filename = "document.pdf"
 
-        # Handle PDF input - encode as base64
-        if pdf:
-            question = self._encode_pdf_file(pdf, question, messages)
+                user_question = question or "Please analyze and summarize the content of this PDF."
 
-        # Handle PDF URL input
-        if pdf_url:
-            self.logger.info(json.dumps({
-                "log_message": "PDF URL provided for analysis",
-                "pdf_url": pdf_url
-            }))
-
-            # Extract filename from URL
-            pdf_filename = pdf_url.split('/')[-1]
-            if not pdf_filename or not pdf_filename.lower().endswith('.pdf'):
-                pdf_filename = "document.pdf"
+                try:
+                    message = self._create_pdf_multimodal_message(user_question, pdf_url, pdf_filename)
+                    # Message plus fallback note, added in one step
+                    messages.extend((message, {
+                        "role": "system",
+                        "content": ("Note: If you're unable to access the PDF content directly, please inform the user "
+                                  "that the PDF could not be processed, and ask them to try using a different PDF URL "
+                                  "or downloading the PDF first.")
+                    }))
 
-            user_question = question or "Please analyze and summarize the content of this PDF."
+                    question = None  # Mark question as consumed
 
-            try:
-                message = self._create_pdf_multimodal_message(user_question, pdf_url, pdf_filename)
-                messages.append(message)
+                    log_json(self.logger, logging.DEBUG, "Created multimodal message for PDF URL")
+                except Exception as e:
+                    log_json(self.logger, logging.ERROR, "Error creating PDF URL message format", error=str(e))
 
-                # Add fallback note
+                    messages.extend(({
+                        "role": "user",
+                        "content": user_question
+                    }, {
+                        "role": "system",
+                        "content": (f"The user attempted to provide a PDF URL '{pdf_url}', "
+                                    f"but it couldn't be processed. Please inform them that the PDF URL "
+                                    f"may not be valid or directly accessible.")
+                    }))
+                    question = None  # Mark question as consumed
+
+            # Add pattern-specific context if specified
+            if pattern_id is not None:
+                resolved_pattern_id = self._handle_pattern_context(
+                    pattern_id, pattern_input, messages
+                )
+                if resolved_pattern_id is None:
+                    return None, None
+
+            # Add format instructions
+            if pattern_id is None: # Only if no pattern is used -> question logic
                 messages.append({
                     "role": "system",
-                    "content": ("Note: If you're unable to access the PDF content directly, please inform the user "
-                              "that the PDF could not be processed, and ask them to try using a different PDF URL "
-                              "or downloading the PDF first.")
+                    "content": build_format_instruction(response_format, model_name)
                 })
 
-                question = None  # Mark question as consumed
-
-                self.logger.debug(json.dumps({
-                    "log_message": "Created multimodal message for PDF URL"
-                }))
-            except Exception as e:
-                self.logger.error(json.dumps({
-                    "log_message": "Error creating PDF URL message format",
-                    "error": str(e)
-                }))
-
+            # Add user question if provided
+            if question:
                 messages.append({
                     "role": "user",
-                    "content": user_question
-                })
-                messages.append({
-                    "role": "system",
-                    "content": (f"The user attempted to provide a PDF URL '{pdf_url}', but it couldn't be processed. "
-                              f"Please inform them that the PDF URL may not be valid or directly accessible.")
+                    "content": question
                 })
-                question = None  # Mark question as consumed
 
-        # Add pattern-specific context if specified
-        if pattern_id is not None:
-            resolved_pattern_id = self._handle_pattern_context(
-                pattern_id, pattern_input, messages
-            )
-            if resolved_pattern_id is None:
-                return None, None
-
-        # Add format instructions
-        if pattern_id is None: # Only if no pattern is used -> question logic
-            messages.append({
-                "role": "system",
-                "content": build_format_instruction(response_format, model_name)
-            })
-
-        # Add user question if provided
-        if question:
-            messages.append({
-                "role": "user",
-                "content": question
-            })
-
-        return messages, resolved_pattern_id
+            return messages, resolved_pattern_id
+        finally:
+            # The encodings are only needed while building this message list,
+            # including the pattern attachments
+            self._encodings.clear()
 
     def _handle_pattern_context(
         self,
@@ -455,10 +535,7 @@ class MessageBuilder:
         else:
             resolved_pattern_id = pattern_id
 
-        self.logger.info(json.dumps({
-            "log_message": "Pattern used",
-            "pattern": resolved_pattern_id
-        }))
+        log_json(self.logger, logging.INFO, "Pattern used", pattern=resolved_pattern_id)
 
         pattern_data = self.pattern_manager.get_pattern_content(resolved_pattern_id)
         if pattern_data is None:
@@ -480,119 +557,99 @@ class MessageBuilder:
             "content": pattern_prompt
         })
 
-        # Check for special file inputs and handle them specially
-        image_file_input = None
-        pdf_file_input = None
-        image_base64 = None
-        structured_inputs = dict(pattern_inputs)  # Make a copy to modify
-
-        # Check if there are any special inputs to handle (image_file, pdf_file, image_url, pdf_url)
+        # Collect special inputs (image_file, pdf_file, image_url, pdf_url) in one pass
+        attachments: List[Tuple[str, str, Any]] = []
         for input_def in pattern_data.get('inputs', []):
-            # Handle image files
-            if input_def.input_type.value == "image_file" and input_def.name in pattern_inputs:
-                image_file_input = pattern_inputs[input_def.name]
-                structured_inputs.pop(input_def.name, None)
-
-                if image_file_input is not None:
-                    self.logger.info(json.dumps({
-                        "log_message": "Processing image_file from pattern input",
-                        "image_path": image_file_input
-                    }))
+            if input_def.name not in pattern_inputs:
+                continue
+            if input_def.input_type.value in ("image_file", "pdf_file"):
+                kind = input_def.input_type.value
+            elif input_def.name in ("pdf_url", "image_url"):
+                kind = input_def.name
+            else:
+                continue
+            attachments.append((kind, input_def.name, pattern_inputs[input_def.name]))
 
-                    mime_type = self._get_mime_type(image_file_input)
-                    image_base64 = encode_file_to_base64(image_file_input)
+        # Attachments are sent as multimodal messages, everything else as structured inputs
+        if attachments:
+            handled = {name for _, name, _ in attachments}
+            structured_inputs = {k: v for k, v in pattern_inputs.items() if k not in handled}
+        else:
+            structured_inputs = pattern_inputs
 
-                    if image_base64:
-                        user_question = "Please analyze this image based on the provided inputs."
-                        message = self._create_image_multimodal_message(
-                            user_question, image_base64, mime_type
-                        )
-                        messages.append(message)
+        for kind, _, value in attachments:
+            if value is None:
+                continue
 
-                        self.logger.debug(json.dumps({
-                            "log_message": "Created multimodal message for pattern image input"
-                        }))
+            # Handle image files
+            if kind == "image_file":
+                log_json(
+                    self.logger, logging.INFO, "Processing image_file from pattern input",
+                    image_path=value
+                )
+                self._encode_image_file(
+                    value, "Please analyze this image based on the provided inputs.", messages
+                )
 
             # Handle PDF files
-            elif input_def.input_type.value == "pdf_file" and input_def.name in pattern_inputs:
-                pdf_file_input = pattern_inputs[input_def.name]
-                structured_inputs.pop(input_def.name, None)
-
-                if pdf_file_input is not None:
-                    self.logger.info(json.dumps({
-                        "log_message": "Processing pdf_file from pattern input",
-                        "pdf_path": pdf_file_input
-                    }))
-
-                    pdf_filename = os.path.basename(pdf_file_input)
-                    pdf_base64 = encode_file_to_base64(pdf_file_input)
-
-                    if pdf_base64:
-                        user_question = "Please analyze this PDF document based on the provided inputs."
-                        message = self._create_pdf_multimodal_message(
-                            user_question, pdf_base64, pdf_filename
-                        )
-                        messages.append(message)
-
-                        self.logger.debug(json.dumps({
-                            "log_message": "Created multimodal message for pattern PDF input"
-                        }))
+            elif kind == "pdf_file":
+                log_json(
+                    self.logger, logging.INFO, "Processing pdf_file from pattern input",
+                    pdf_path=value
+                )
+                self._encode_pdf_file(
+                    value, "Please analyze this PDF document based on the provided inputs.", messages
+                )
 
             # Handle PDF URL inputs from pattern
-            elif input_def.name == "pdf_url" and input_def.name in pattern_inputs:
-                pdf_url = pattern_inputs[input_def.name]
-                structured_inputs.pop(input_def.name, None)
-
-                if pdf_url is not None:
-                    self.logger.info(json.dumps({
-                        "log_message": "Processing pdf_url from pattern input",
-                        "pdf_url": pdf_url
-                    }))
-
-                    try:
-                        pdf_filename = pdf_url.split('/')[-1]
-                        if not pdf_filename.lower().endswith('.pdf'):
-                            pdf_filename += '.pdf'
-
-                        user_question = "Please analyze and summarize this PDF document based on the provided inputs."
-                        message = self._create_pdf_multimodal_message(user_question, pdf_url, pdf_filename)
-                        messages.append(message)
-
-                        self.logger.debug(json.dumps({
-                            "log_message": "Created multimodal message for pattern PDF URL input"
-                        }))
-
-                    except Exception as e:
-                        self.logger.error(json.dumps({
-                            "log_message": "Error processing PDF URL from pattern input",
-                            "error": str(e)
-                        }))
+            elif kind == "pdf_url":
+                pdf_url = value
+                log_json(
+                    self.logger, logging.INFO, "Processing pdf_url from pattern input",
+                    pdf_url=pdf_url
+                )
+
+                try:
+                    pdf_filename = pdf_url.rsplit('/', 1)[-1]
+                    if not _has_pdf_suffix(pdf_filename):
+                        pdf_filename += '.pdf'
+
+                    user_question = "Please analyze and summarize this PDF document based on the provided inputs."
+                    message = self._create_pdf_multimodal_message(user_question, pdf_url, pdf_filename)
+                    messages.append(message)
+
+                    log_json(
+                        self.logger, logging.DEBUG, "Created multimodal message for pattern PDF URL input"
+                    )
+
+                except Exception as e:
+                    log_json(
+                        self.logger, logging.ERROR, "Error processing PDF URL from pattern input",
+                        error=str(e)
+                    )
 
             # Handle image URL inputs from pattern
-            elif input_def.name == "image_url" and input_def.name in pattern_inputs:
-                image_url = pattern_inputs[input_def.name]
-                structured_inputs.pop(input_def.name, None)
-
-                if image_url is not None:
-                    self.logger.info(json.dumps({
-                        "log_message": "Processing image_url from pattern input",
-                        "image_url": image_url
-                    }))
-
-                    try:
-                        user_question = "Please analyze and describe this image based on the provided inputs."
-                        message = self._create_image_multimodal_message(user_question, image_url, "jpeg")
-                        messages.append(message)
-
-                        self.logger.debug(json.dumps({
-                            "log_message": "Created multimodal message for pattern image URL input"
-                        }))
-
-                    except Exception as e:
-                        self.logger.error(json.dumps({
-                            "log_message": "Error processing image URL from pattern input",
-                            "error": str(e)
-                        }))
+            elif kind == "image_url":
+                image_url = value
+                log_json(
+                    self.logger, logging.INFO, "Processing image_url from pattern input",
+                    image_url=image_url
+                )
+
+                try:
+                    user_question = "Please analyze and describe this image based on the provided inputs."
+                    message = self._create_image_multimodal_message(user_question, image_url, "jpeg")
+                    messages.append(message)
+
+                    log_json(
+                        self.logger, logging.DEBUG, "Created multimodal message for pattern image URL input"
+                    )
+
+                except Exception as e:
+                    log_json(
+                        self.logger, logging.ERROR, "Error processing image URL from pattern input",
+                        error=str(e)
+                    )
 
         # If there are inputs (excluding handled image_file), provide them in a structured way
         if structured_inputs:
@@ -4,6 +4,8 @@ Patterns package for Ask AI.
 This package implements the pattern system for configuring AI prompts,
 managing inputs and outputs, and specialized use cases through predefined templates.
 """
+from typing import TYPE_CHECKING
+
 from .configuration import (
     PatternConfiguration,
     PatternPurpose,
@@ -12,7 +14,10 @@ from .configuration import (
 from .inputs import PatternInput, InputType
 from .outputs import PatternOutput
 from .manager import PatternManager
-from .processor import PatternProcessor
+
+if TYPE_CHECKING:
+    # Static definition for type checkers and linters, resolved lazily by __getattr__
+    from .processor import PatternProcessor
 
 __all__ = [
     'PatternConfiguration',
@@ -24,3 +29,15 @@ __all__ = [
     'PatternManager',
     'PatternProcessor'
 ]
+
+
+def __getattr__(name):
+    """Import the pattern processor on first access.
+
+    Keeps ``import askai.core.patterns`` (used for pattern listing and parsing)
+    from pulling in AIService, the OpenRouter client and the output stack.
+    """
+    if name == 'PatternProcessor':
+        from .processor import PatternProcessor  # pylint: disable=import-outside-toplevel
+        return PatternProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,17 @@ This module contains the classes needed to configure AI interaction patterns,
 including pattern purposes, functionalities, and pattern-specific configurations.
 """
 
+import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from askai.utils import print_error_or_warnings
 from askai.core.ai.models import ModelConfiguration
 
-@dataclass
+# Markdown bullet lines: optional horizontal whitespace, then '*'
+_BULLET_LINE_RE = re.compile(r'^[^\S\n]*\*.*$', re.MULTILINE)
+
+
+@dataclass(slots=True)
 class PatternPurpose:
     """
     Defines the purpose and intent of an interaction pattern.
@@ -29,7 +34,7 @@ class PatternPurpose:
             description=description
         )
 
-@dataclass
+@dataclass(slots=True)
 class PatternFunctionality:
     """
     Describes the specific capabilities of an interaction pattern.
@@ -43,11 +48,10 @@ class PatternFunctionality:
     def from_text(cls, content: str) -> 'PatternFunctionality':
         """Create a PatternFunctionality instance from markdown bullet points."""
         # Extract bullet points, removing empty lines and stripping whitespace
-        features = [line.strip('* ').strip() for line in content.split('\n')
-                   if line.strip().startswith('*')]
+        features = [line.strip('* ').strip() for line in _BULLET_LINE_RE.findall(content)]
         return cls(features=features)
 
-@dataclass
+@dataclass(slots=True)
 class PatternConfiguration:  # pylint: disable=too-many-instance-attributes
     """
     Complete configuration for an AI interaction pattern.
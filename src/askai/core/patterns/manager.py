@@ -11,6 +11,12 @@ import os
 import logging
 from typing import List, Dict, Any, Optional, Union, Tuple
 import yaml
+
+# Use the libyaml C implementation when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from askai.utils import print_error_or_warnings
 from .inputs import PatternInput, InputGroup, InputType
 from .outputs import PatternOutput
@@ -169,7 +175,7 @@ class PatternManager:
             yaml_block = yaml_text.split("```yaml")[1].split("```")[0]
 
             # Parse the yaml
-            inputs_data = yaml.safe_load(yaml_block)
+            inputs_data = yaml.load(yaml_block, Loader=SafeLoader)
 
             # Convert to PatternInput objects
             pattern_inputs = [PatternInput.from_dict(input_data) for input_data in inputs_data.get('inputs', [])]
@@ -236,7 +242,7 @@ class PatternManager:
         try:
             yaml_text = content.split("## Pattern Outputs")[1]
             yaml_block = yaml_text.split("```yaml")[1].split("```")[0]
-            outputs_data = yaml.safe_load(yaml_block)
+            outputs_data = yaml.load(yaml_block, Loader=SafeLoader)
 
             # Check for the 'results' key first, fall back to 'outputs' for backward compatibility
             outputs_list = outputs_data.get('results', outputs_data.get('outputs', []))
@@ -284,7 +290,7 @@ class PatternManager:
                 # Join the execution lines and parse as YAML
                 if execution_lines:
                     execution_yaml = '\n'.join(execution_lines)
-                    parsed_execution = yaml.safe_load(execution_yaml)
+                    parsed_execution = yaml.load(execution_yaml, Loader=SafeLoader)
 
                     if isinstance(parsed_execution, dict):
                         execution_config.update(parsed_execution)
@@ -381,7 +387,7 @@ class PatternManager:
             yaml_content = '\n'.join(yaml_lines)
 
             # Parse the YAML content
-            config_data = yaml.safe_load(yaml_content)
+            config_data = yaml.load(yaml_content, Loader=SafeLoader)
 
             # Get the model configuration and format_instructions
             if isinstance(config_data, dict):
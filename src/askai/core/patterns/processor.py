@@ -3,19 +3,25 @@ Pattern processing orchestration.
 Handles pattern-based question processing separate from general question flow.
 """
 
-import json
+import logging
+import re
 from typing import Optional, Tuple, List, Dict, Any
 
 from askai.core.ai import AIService
 from askai.core.messaging import MessageBuilder
 from askai.core.patterns import PatternManager
 from askai.output import OutputCoordinator
+from askai.utils import json_loads, log_json
+
+# Matches content that starts with a JSON object, without copying it to strip whitespace
+_JSON_OBJECT_START = re.compile(r'\s*\{')
 
 
 class PatternProcessor:
     """Handles pattern-based question processing."""
 
-    def __init__(self, config: Dict[str, Any], logger, base_path: str):
+    def __init__(self, config: Dict[str, Any], logger, base_path: str,
+                 pattern_manager: Optional[PatternManager] = None):
         """
         Initialize the pattern processor.
 
@@ -23,17 +29,22 @@ class PatternProcessor:
             config: Application configuration dictionary
             logger: Logger instance
             base_path: Base path for pattern directories
+            pattern_manager: Optional existing PatternManager to reuse instead of creating a new one
         """
         self.config = config
         self.logger = logger
         self.base_path = base_path
 
         # Initialize required components
-        self.pattern_manager = PatternManager(base_path, config)
+        self.pattern_manager = pattern_manager if pattern_manager is not None else PatternManager(base_path, config)
         self.message_builder = MessageBuilder(self.pattern_manager, logger)
         self.ai_service = AIService(logger)
         self.output_handler = OutputCoordinator()
 
+    def close(self) -> None:
+        """Release the AI service's spinner worker and HTTP session once no more patterns follow."""
+        self.ai_service.close()
+
     def process_pattern(self, args) -> Optional[Tuple[str, List[str], OutputCoordinator]]:
         """
         Process a pattern-based request.
@@ -62,15 +73,10 @@ class PatternProcessor:
 
         # Check if message building was cancelled
         if messages is None or resolved_pattern_id is None:
-            self.logger.info(json.dumps({
-                "log_message": "Pattern input collection cancelled by user"
-            }))
+            log_json(self.logger, logging.INFO, "Pattern input collection cancelled by user")
             return None
 
-        self.logger.debug(json.dumps({
-            "log_message": "Pattern messages content",
-            "messages": messages
-        }))
+        log_json(self.logger, logging.DEBUG, "Pattern messages content", messages=messages)
 
         # Get AI response
         response = self.ai_service.get_ai_response(
@@ -111,12 +117,12 @@ class PatternProcessor:
         try:
             if isinstance(response, dict) and 'content' in response:
                 content = response['content']
-                if isinstance(content, str) and content.strip().startswith('{'):
+                if isinstance(content, str) and _JSON_OBJECT_START.match(content):
                     parsed_json = self._try_parse_results_json(content)
                     if parsed_json is not None:
                         return parsed_json
         except (ValueError, TypeError, KeyError, AttributeError) as e:
-            self.logger.debug("Error normalizing response: %s", str(e))
+            log_json(self.logger, logging.DEBUG, "Error normalizing response", error=str(e))
         return response
 
     def _try_parse_results_json(self, content: str) -> Optional[Dict[str, Any]]:
@@ -130,10 +136,10 @@ class PatternProcessor:
             Parsed JSON dict if successful and contains 'results', None otherwise
         """
         try:
-            parsed_json = json.loads(content)
+            parsed_json = json_loads(content)
             if isinstance(parsed_json, dict) and 'results' in parsed_json:
-                self.logger.debug("Found direct JSON with results in content")
+                log_json(self.logger, logging.DEBUG, "Found direct JSON with results in content")
                 return parsed_json
-        except json.JSONDecodeError:
-            self.logger.debug("Content is not valid JSON")
+        except ValueError:
+            log_json(self.logger, logging.DEBUG, "Content is not valid JSON")
         return None
@@ -42,6 +42,10 @@ class QuestionProcessor:  # pylint: disable=too-few-public-methods,too-many-inst
         from askai.output import OutputCoordinator
         self.output_coordinator = OutputCoordinator()
 
+    def close(self) -> None:
+        """Release the AI service's spinner worker and HTTP session once no more questions follow."""
+        self.ai_service.close()
+
     def process_question(self, args) -> QuestionResponse:
         """Process a standalone question.
 
@@ -16,23 +16,21 @@ src_dir = os.path.dirname(script_dir)  # Go up from src/askai to src
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
-# Local application imports - grouped by package
-# pylint: disable=wrong-import-position
-from askai.core.chat import ChatManager
-from askai.core.patterns import PatternManager, PatternProcessor
-from askai.core.questions import QuestionProcessor
-
+# Local application imports - the heavier components (Textual TUI, managers and
+# processors) are imported inside the branches that need them to keep startup fast
+# pylint: disable=wrong-import-position,import-outside-toplevel
 from askai.utils import load_config, setup_logger, print_error_or_warnings
 
-from askai.presentation.cli import CommandHandler
-from askai.presentation.cli.parser import CLIParser
-from askai.presentation.tui.apps.tabbed_tui_app import run_tabbed_tui
+# Arguments that request help, checked with a single pass over sys.argv
+_HELP_FLAGS = frozenset(('-h', '--help'))
 
 def display_help_fast():
     """
     Display help information with minimal imports.
     This function is optimized to avoid unnecessary imports when only help is needed.
     """
+    from askai.presentation.cli.parser import CLIParser
+
     cli_parser = CLIParser()
     cli_parser.parse_arguments()  # This will display help and exit
 
@@ -40,7 +38,7 @@ def main():  # pylint: disable=too-many-locals,too-many-branches,too-many-statem
     """Main entry point for the Ask AI application."""
     # Check if this is a help request (before any heavy initialization)
     # Use most efficient path for help commands
-    if '-h' in sys.argv or '--help' in sys.argv:
+    if not _HELP_FLAGS.isdisjoint(sys.argv):
         display_help_fast()
         return  # Exit after displaying help
 
@@ -54,6 +52,11 @@ def main():  # pylint: disable=too-many-locals,too-many-branches,too-many-statem
             if default_mode == 'tui':
                 # Try to launch TUI mode
                 try:
+                    from askai.core.chat import ChatManager
+                    from askai.core.patterns import PatternManager
+                    from askai.core.questions import QuestionProcessor
+                    from askai.presentation.tui.apps.tabbed_tui_app import run_tabbed_tui
+
                     # Initialize minimal components for TUI
                     base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
                     logger = setup_logger(config, False)
@@ -63,11 +66,14 @@ def main():  # pylint: disable=too-many-locals,too-many-branches,too-many-statem
                     question_processor = QuestionProcessor(config, logger, base_path)
 
                     # Launch TUI
-                    run_tabbed_tui(
-                        pattern_manager=pattern_manager,
-                        chat_manager=chat_manager,
-                        question_processor=question_processor
-                    )
+                    try:
+                        run_tabbed_tui(
+                            pattern_manager=pattern_manager,
+                            chat_manager=chat_manager,
+                            question_processor=question_processor
+                        )
+                    finally:
+                        question_processor.close()
                     return
                 except Exception as e:
                     print(f"TUI mode failed: {e}. Falling back to CLI help.")
@@ -79,6 +85,11 @@ def main():  # pylint: disable=too-many-locals,too-many-branches,too-many-statem
         display_help_fast()
         return
 
+    from askai.core.chat import ChatManager
+    from askai.core.patterns import PatternManager
+    from askai.presentation.cli import CommandHandler
+    from askai.presentation.cli.parser import CLIParser
+
     # For non-help commands, initialize CLI parser first
     cli_parser = CLIParser()
     args = cli_parser.parse_arguments()
@@ -134,8 +145,13 @@ def main():  # pylint: disable=too-many-locals,too-many-branches,too-many-statem
     if using_pattern:
         # === PATTERN MODE ===
         # Use the dedicated pattern processor
-        pattern_processor = PatternProcessor(config, logger, base_path)
-        result = pattern_processor.process_pattern(args)
+        from askai.core.patterns import PatternProcessor
+
+        pattern_processor = PatternProcessor(config, logger, base_path, pattern_manager=pattern_manager)
+        try:
+            result = pattern_processor.process_pattern(args)
+        finally:
+            pattern_processor.close()
 
         if result:
             formatted_output, created_files, output_handler = result
@@ -154,8 +170,13 @@ def main():  # pylint: disable=too-many-locals,too-many-branches,too-many-statem
     else:
         # === CHAT/QUESTION MODE ===
         # Use the dedicated question processor
+        from askai.core.questions import QuestionProcessor
+
         question_processor = QuestionProcessor(config, logger, base_path)
-        response_obj = question_processor.process_question(args)
+        try:
+            response_obj = question_processor.process_question(args)
+        finally:
+            question_processor.close()
 
         # The question processor returns a QuestionResponse object
         formatted_output = response_obj.content
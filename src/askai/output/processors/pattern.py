@@ -5,16 +5,91 @@ including categorizing outputs, extracting pattern contents, and managing
 pattern-specific file operations.
 """
 
+import functools
 import json
 import re
 import logging
+import os
 from typing import List, Tuple, Dict, Union, Optional, Any
-from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from askai.core.patterns.outputs import PatternOutput, OutputAction
 
 logger = logging.getLogger(__name__)
 
+_PATTERN_FLAGS = re.DOTALL | re.MULTILINE | re.IGNORECASE
+
+# Each pattern is paired with the lowercase literals every match must contain. Checking
+# the literals with plain substring searches first skips regexes that cannot match,
+# which avoids backtracking through large responses with lazy DOTALL groups (e.g. an
+# unterminated HTML document would otherwise be rescanned to the end of the text).
+_HTML_PATTERNS = (
+    (('```html',), re.compile(r'```html\s*\n(.*?)\n```', _PATTERN_FLAGS)),
+    (('<!doctype html', '</html>'), re.compile(r'(<!DOCTYPE html.*?</html>)', _PATTERN_FLAGS)),
+)
+_CSS_PATTERNS = ((('```css',), re.compile(r'```css\s*\n(.*?)\n```', _PATTERN_FLAGS)),)
+_JS_PATTERNS = (
+    (('```javascript',), re.compile(r'```javascript\s*\n(.*?)\n```', _PATTERN_FLAGS)),
+    (('```js',), re.compile(r'```js\s*\n(.*?)\n```', _PATTERN_FLAGS)),
+)
+_JSON_PATTERNS = ((('```json',), re.compile(r'```json\s*\n(.*?)\n```', _PATTERN_FLAGS)),)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_output_patterns(output_name: str) -> Tuple[Tuple[Tuple[str, ...], re.Pattern], ...]:
+    """Compile the search patterns for an output, in the order they are tried.
+
+    Args:
+        output_name: Name of the pattern output
+
+    Returns:
+        Tuple of (required literals, compiled pattern) pairs, where the first group
+        of each pattern holds the output content
+    """
+    name = re.escape(output_name)
+    lowered = output_name.lower()
+    label = (lowered + ':',)
+
+    # Add specific patterns based on output name
+    if 'html' in lowered or 'page' in lowered:
+        named = (
+            (label, rf'{name}:\s*```html\s*\n(.*?)\n```'),
+            (label + ('<!doctype', '</html>'), rf'{name}:\s*```\s*\n(<!DOCTYPE.*?</html>)\s*\n```'),
+        )
+        fallbacks = _HTML_PATTERNS
+    elif 'css' in lowered or 'style' in lowered:
+        named = ((label, rf'{name}:\s*```css\s*\n(.*?)\n```'),)
+        fallbacks = _CSS_PATTERNS
+    elif 'js' in lowered or 'javascript' in lowered:
+        named = (
+            (label, rf'{name}:\s*```javascript\s*\n(.*?)\n```'),
+            (label, rf'{name}:\s*```js\s*\n(.*?)\n```'),
+        )
+        fallbacks = _JS_PATTERNS
+    elif 'json' in lowered:
+        named = ((label, rf'{name}:\s*```json\s*\n(.*?)\n```'),)
+        fallbacks = _JSON_PATTERNS
+    else:
+        # Generic patterns
+        named = (
+            (label, rf'{name}:\s*```\w*\s*\n(.*?)\n```'),
+            (label, rf'{name}:\s*(.+?)(?=\n\w+:|$)'),
+            (('## ' + lowered,), rf'## {name}\s*\n(.*?)(?=\n##|$)'),
+            (('**' + lowered + '**:',), rf'\*\*{name}\*\*:\s*(.+?)(?=\n|$)'),
+        )
+        fallbacks = ()
+
+    # Case-insensitive matching of non-ASCII names does not map cleanly onto casefold()
+    if not output_name.isascii():
+        named = tuple(((), pattern) for _, pattern in named)
+
+    return tuple((literals, re.compile(p, _PATTERN_FLAGS)) for literals, p in named) + fallbacks
+
+
 class PatternProcessor:
     """Processes pattern-based outputs from AI responses."""
 
@@ -47,8 +122,9 @@ class PatternProcessor:
 
         try:
             # Get output directory if needed for file outputs
-            output_dir = self._get_output_dir_if_needed(pattern_outputs)
-            if output_dir is None and any(output.action == OutputAction.WRITE for output in pattern_outputs):
+            file_outputs, _, _ = self._categorize_outputs(pattern_outputs)
+            output_dir = self.directory_manager.get_output_directory() if file_outputs else None
+            if output_dir is None and file_outputs:
                 logger.warning("No output directory available for file outputs")
                 return created_files
 
@@ -88,26 +164,18 @@ class PatternProcessor:
         Returns:
             Tuple of (file_outputs, display_outputs, command_outputs)
         """
-        file_outputs = []
-        display_outputs = []
-        command_outputs = []
+        buckets: Dict[OutputAction, List[PatternOutput]] = {
+            OutputAction.WRITE: [],
+            OutputAction.DISPLAY: [],
+            OutputAction.EXECUTE: [],
+        }
 
         for output in pattern_outputs:
-            if output.action == OutputAction.WRITE:
-                file_outputs.append(output)
-            elif output.action == OutputAction.DISPLAY:
-                display_outputs.append(output)
-            elif output.action == OutputAction.EXECUTE:
-                command_outputs.append(output)
-
-        return file_outputs, display_outputs, command_outputs
-
-    def _get_output_dir_if_needed(self, pattern_outputs: List[PatternOutput]) -> Optional[str]:
-        """Get output directory if file outputs exist."""
-        file_outputs_exist = any(output.action == OutputAction.WRITE for output in pattern_outputs)
-        if file_outputs_exist:
-            return self.directory_manager.get_output_directory()
-        return None
+            bucket = buckets.get(output.action)
+            if bucket is not None:
+                bucket.append(output)
+
+        return buckets[OutputAction.WRITE], buckets[OutputAction.DISPLAY], buckets[OutputAction.EXECUTE]
 
     def _process_file_output(self, output: PatternOutput, content: str,
                             output_dir: Optional[str], created_files: List[str]) -> None:
@@ -135,13 +203,21 @@ class PatternProcessor:
         text = self._get_response_text(response)
         structured_data = self._extract_and_log_structured_data(response)
 
+        # Collect where each output came from and log it once instead of per output
+        sources: List[Tuple[str, Optional[str]]] = []
+
         contents = {}
         for output in pattern_outputs:
-            content = self._find_content_for_output(output, structured_data, text)
+            content, source = self._find_content_for_output(output, structured_data, text)
             if content:
                 contents[output.name] = self._format_content(content)
-            else:
-                logger.warning("No content found for output: %s", output.name)
+            sources.append((output.name, source if content else None))
+
+        logger.info("Pattern output sources: %s", sources)
+        missing = [name for name, source in sources if source is None]
+        if missing:
+            logger.warning("No content found for outputs %s (structured data keys: %s)",
+                           missing, list(structured_data.keys()))
 
         return contents
 
@@ -158,28 +234,31 @@ class PatternProcessor:
         logger.info("Structured data keys: %s", list(structured_data.keys()) if structured_data else "None")
         return structured_data
 
-    def _find_content_for_output(self, output: PatternOutput, structured_data: Dict, text: str) -> Optional[Any]:
-        """Find content for a specific output from structured data or text."""
+    def _find_content_for_output(self, output: PatternOutput, structured_data: Dict,
+                                 text: str) -> Tuple[Optional[Any], Optional[str]]:
+        """Find content for a specific output from structured data or text.
+
+        Returns:
+            Tuple of (content, source) where source is 'structured_data' or 'pattern_extraction'
+        """
         # First try structured data
         if output.name in structured_data:
-            content = structured_data[output.name]
-            logger.info("Found content for %s in structured data (type: %s)",
-                       output.name, type(content).__name__)
-            return content
-
-        logger.warning("Output %s not found in structured data keys: %s",
-                      output.name, list(structured_data.keys()))
+            return structured_data[output.name], 'structured_data'
 
         # Fall back to pattern-based extraction
-        content = self._extract_output_content_from_response(text, output)
-        if content:
-            logger.info("Found content for %s via pattern extraction", output.name)
-        return content
+        return self._extract_output_content_from_response(text, output), 'pattern_extraction'
 
     def _format_content(self, content: Any) -> str:
         """Format content as string, handling dicts/lists specially."""
         if isinstance(content, (dict, list)):
+            if orjson is not None:
+                try:
+                    return orjson.dumps(content, option=orjson.OPT_INDENT_2).decode()
+                except TypeError:
+                    pass  # e.g. non-string keys or integers wider than 64 bits
             return json.dumps(content, indent=2)
+        if isinstance(content, str):
+            return content.strip()
         return str(content).strip()
 
     def _extract_output_content_from_response(self, text: str, output: PatternOutput) -> Optional[str]:
@@ -192,50 +271,13 @@ class PatternProcessor:
         Returns:
             Extracted content or None
         """
-        output_name = output.name.lower()
-
-        # Define search patterns for common output names
-        patterns = []
-
-        # Add specific patterns based on output name
-        if 'html' in output_name or 'page' in output_name:
-            patterns.extend([
-                rf'{re.escape(output.name)}:\s*```html\s*\n(.*?)\n```',
-                rf'{re.escape(output.name)}:\s*```\s*\n(<!DOCTYPE.*?</html>)\s*\n```',
-                r'```html\s*\n(.*?)\n```',
-                r'(<!DOCTYPE html.*?</html>)',
-            ])
-        elif 'css' in output_name or 'style' in output_name:
-            patterns.extend([
-                rf'{re.escape(output.name)}:\s*```css\s*\n(.*?)\n```',
-                r'```css\s*\n(.*?)\n```',
-            ])
-        elif 'js' in output_name or 'javascript' in output_name:
-            patterns.extend([
-                rf'{re.escape(output.name)}:\s*```javascript\s*\n(.*?)\n```',
-                rf'{re.escape(output.name)}:\s*```js\s*\n(.*?)\n```',
-                r'```javascript\s*\n(.*?)\n```',
-                r'```js\s*\n(.*?)\n```',
-            ])
-        elif 'json' in output_name:
-            patterns.extend([
-                rf'{re.escape(output.name)}:\s*```json\s*\n(.*?)\n```',
-                r'```json\s*\n(.*?)\n```',
-            ])
-        else:
-            # Generic patterns
-            patterns.extend([
-                rf'{re.escape(output.name)}:\s*```\w*\s*\n(.*?)\n```',
-                rf'{re.escape(output.name)}:\s*(.+?)(?=\n\w+:|$)',
-                rf'## {re.escape(output.name)}\s*\n(.*?)(?=\n##|$)',
-                rf'\*\*{re.escape(output.name)}\*\*:\s*(.+?)(?=\n|$)',
-            ])
-
-        # Try each pattern
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.DOTALL | re.MULTILINE | re.IGNORECASE)
-            if matches:
-                content = matches[0].strip()
+        haystack = text.casefold()
+        for literals, pattern in _compile_output_patterns(output.name):
+            if not all(literal in haystack for literal in literals):
+                continue
+            match = pattern.search(text)
+            if match:
+                content = match.group(1).strip()
                 return self.content_extractor.clean_escaped_content(content)
 
         return None
@@ -254,9 +296,9 @@ class PatternProcessor:
             return None
 
         try:
-            # PatternOutput uses write_to_file for filename
-            file_path = Path(output_dir) / output.write_to_file
-            return str(file_path.resolve())
+            # PatternOutput uses write_to_file for filename. abspath only normalizes the
+            # string, unlike Path.resolve() it does not hit the filesystem per output
+            return os.path.abspath(os.path.join(output_dir, output.write_to_file))
 
         except Exception as e:
             logger.error("Error creating file path for output %s: %s", output.name, str(e))
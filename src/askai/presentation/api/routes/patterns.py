@@ -609,18 +609,21 @@ class PatternExecution(Resource):
 
         logger.info("Built %d messages for pattern '%s'", len(messages), pattern_id)
 
-        # Initialize AI service
+        # Initialize AI service for this request; it is not shared across threads
         ai_service = AIService(logger)
 
         # Execute pattern through AI service
-        ai_response = ai_service.get_ai_response(
-            messages=messages,
-            model_name=model_name,
-            pattern_id=resolved_pattern_id,
-            debug=debug_mode,
-            pattern_manager=pattern_manager,
-            enable_url_search=False
-        )
+        try:
+            ai_response = ai_service.get_ai_response(
+                messages=messages,
+                model_name=model_name,
+                pattern_id=resolved_pattern_id,
+                debug=debug_mode,
+                pattern_manager=pattern_manager,
+                enable_url_search=False
+            )
+        finally:
+            ai_service.close()
 
         if not ai_response:
             logger.error("No response received from AI service for pattern '%s'", pattern_id)
@@ -802,18 +805,21 @@ class PatternFileExecution(Resource):
 
             logger.info("Built %d messages for pattern '%s'", len(messages), pattern_id)
 
-            # Initialize AI service with application logger
+            # Initialize AI service for this request with application logger
             ai_service = AIService(logger)
 
             # Execute pattern through AI service
-            ai_response = ai_service.get_ai_response(
-                messages=messages,
-                model_name=model_name,
-                pattern_id=resolved_pattern_id,
-                debug=debug_mode,
-                pattern_manager=pattern_manager,
-                enable_url_search=False
-            )
+            try:
+                ai_response = ai_service.get_ai_response(
+                    messages=messages,
+                    model_name=model_name,
+                    pattern_id=resolved_pattern_id,
+                    debug=debug_mode,
+                    pattern_manager=pattern_manager,
+                    enable_url_search=False
+                )
+            finally:
+                ai_service.close()
 
             if not ai_response:
                 logger.error("No response received from AI service for pattern '%s'", pattern_id)
@@ -13,7 +13,6 @@ from askai.utils.config import (
     TEST_CHATS_DIR, TEST_CONFIG_PATH, TEST_LOGS_DIR,
     get_config_path, is_test_environment, create_test_config_from_production
 )
-from askai.presentation.tui.apps.tabbed_tui_app import run_tabbed_tui
 
 
 class CommandHandler:
@@ -39,7 +38,7 @@ class CommandHandler:
             return False
 
         # Skip interactive mode during testing
-        if os.environ.get('ASKAI_TESTING', '').lower() in ('true', '1', 'yes'):
+        if is_test_environment():
             return False
 
         try:
@@ -54,12 +53,18 @@ class CommandHandler:
                 question_processor = QuestionProcessor(config, self.logger, base_path)
                 self.logger.info(json.dumps({"log_message": "Created question processor for TUI mode"}))
 
-            # Launch the tabbed TUI interface
-            run_tabbed_tui(
-                pattern_manager=self.pattern_manager,
-                chat_manager=self.chat_manager,
-                question_processor=question_processor
-            )
+            # Launch the tabbed TUI interface; Textual is only imported when it is used
+            from askai.presentation.tui.apps.tabbed_tui_app import run_tabbed_tui  # pylint: disable=import-outside-toplevel
+            try:
+                run_tabbed_tui(
+                    pattern_manager=self.pattern_manager,
+                    chat_manager=self.chat_manager,
+                    question_processor=question_processor
+                )
+            finally:
+                # A processor passed in is released by its owner
+                if question_processor is not self.question_processor:
+                    question_processor.close()
 
             print("Interactive session ended.")
             return True
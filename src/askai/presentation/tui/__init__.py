@@ -6,20 +6,30 @@ chat browsing, and other AskAI features. It gracefully falls back to the traditi
 CLI interface when the terminal is incompatible.
 """
 
+import functools
+import importlib
+import io
 import os
 import sys
 
-import textual  # noqa: F401 # pylint: disable=unused-import # type: ignore[reportUnusedImport]
-
 # Module-level constants for TUI availability
 TEXTUAL_AVAILABLE = True  # Used by other modules to check TUI support
 
 
+@functools.lru_cache(maxsize=1)
 def is_tui_available() -> bool:
-    """Check if TUI can be used in the current environment."""
+    """Check if TUI can be used in the current environment.
+
+    The result is computed once per process, the terminal and environment
+    are not expected to change while AskAI is running.
+    """
 
     # Check if we're in a terminal
-    if not os.isatty(sys.stdout.fileno()):
+    try:
+        if not os.isatty(sys.stdout.fileno()):
+            return False
+    except (io.UnsupportedOperation, ValueError):
+        # stdout has been replaced by an object without a file descriptor
         return False
 
     # Check environment variable override
@@ -31,11 +41,20 @@ def is_tui_available() -> bool:
     if term in ['dumb', '']:
         return False
 
+    # Textual is only imported once the cheaper checks pass
+    try:
+        importlib.import_module('textual')
+    except ImportError:
+        return False
+
     return True
 
 
 def get_tui_config() -> dict:
-    """Get TUI configuration settings."""
+    """Get TUI configuration settings.
+
+    A new dict is built on every call, so callers may modify the result.
+    """
     return {
         'theme': os.environ.get('ASKAI_TUI_THEME', 'dark'),
         'keybindings': {
@@ -4,9 +4,16 @@ Simplified Tabbed TUI Application using component-based architecture.
 Each tab is now a separate, reusable component.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+
+from rich.markdown import Markdown
+from textual import work
 from textual.app import App
-from textual.widgets import Header, Footer, TabbedContent, TabPane
+from textual.containers import VerticalScroll
+from textual.screen import ModalScreen
+from textual.widgets import Header, Footer, Static, TabbedContent, TabPane
 
 # Import our components from parent's components directory
 # pylint: disable=import-error
@@ -14,6 +21,100 @@ from ..components import QuestionTab, PatternTab, ChatTab, ModelTab, CreditsTab
 
 TEXTUAL_AVAILABLE = True
 
+# Tab pane ids in display order, used to pick the neighbouring tab to warm up
+TAB_ORDER = ("question-tab", "pattern-tab", "chat-tab", "model-tab", "credits-tab")
+
+# Seconds to wait for further F-key presses before switching tabs
+TAB_SWITCH_DELAY = 0.05
+
+_HELP_TEXT = """**AskAI Interactive TUI Help**
+
+**Navigation:**
+- F1: Show this help
+- F2: Switch to Question Builder
+- F3: Switch to Pattern Browser
+- F4: Switch to Chat Browser
+- F5: Switch to Model Browser
+- F6: Switch to Credits
+- Ctrl+Q: Quit application
+
+**Tabs:**
+- Question Builder: Create and submit questions to AI
+- Pattern Browser: Browse and use AI patterns
+- Chat Browser: Manage chat history
+- Model Browser: Browse and select AI models
+- Credits: Monitor OpenRouter credit balance and usage
+
+**Question Builder:**
+- Enter your question in the main text area
+- Optionally add file input, URL, or specify format
+- Click "Ask AI" to submit your question
+- Use "Clear" to reset the form
+
+**Pattern Browser:**
+- Browse available patterns in the left panel
+- Select a pattern to view details in the right panel
+- Provide JSON input if the pattern requires it
+- Click "Use Pattern" to execute
+
+**Chat Browser:**
+- View all your chat sessions
+- Create new chats or delete existing ones
+- Select a chat to view details
+
+**Model Browser:**
+- Browse available AI models
+- Search for specific models
+- View model details, pricing, and capabilities
+- Check your OpenRouter credits
+"""
+
+# Parsed once at import, every help screen renders the same Markdown object
+_HELP_MARKDOWN = Markdown(_HELP_TEXT)
+
+
+class HelpScreen(ModalScreen):
+    """Modal screen showing the key bindings and a tour of the tabs."""
+
+    BINDINGS = [("escape", "dismiss", "Close"), ("f1", "dismiss", "Close")]
+
+    DEFAULT_CSS = """
+    HelpScreen {
+        align: center middle;
+    }
+
+    #help-container {
+        background: $surface;
+        border: thick #00FFFF;
+        width: 80%;
+        height: 80%;
+        padding: 1;
+    }
+    """
+
+    def compose(self):
+        """Compose the help screen."""
+        with VerticalScroll(id="help-container"):
+            yield Static(_HELP_MARKDOWN)
+
+
+@dataclass(frozen=True, slots=True)
+class QuestionArgs:  # pylint: disable=too-many-instance-attributes
+    """Arguments container mirroring the CLI namespace for question processing."""
+    question: str
+    file_input: Optional[str] = None
+    url: Optional[str] = None
+    format: str = "rawtext"
+    model: Optional[str] = None
+    output: Optional[str] = None
+    debug: bool = False
+    # These are not supported in TUI yet, but needed for compatibility
+    image: Optional[str] = None
+    pdf: Optional[str] = None
+    image_url: Optional[str] = None
+    pdf_url: Optional[str] = None
+    persistent_chat: Optional[str] = None
+
 
 class TabbedTUIApp(App):  # pylint: disable=too-many-instance-attributes
     """Simplified tabbed TUI application using components."""
@@ -21,11 +122,11 @@ class TabbedTUIApp(App):  # pylint: disable=too-many-instance-attributes
     BINDINGS = [
         ("ctrl+q", "quit", "Quit"),
         ("f1", "help", "Help"),
-        ("f2", "focus_question", "Question"),
-        ("f3", "focus_patterns", "Patterns"),
-        ("f4", "focus_chats", "Chats"),
-        ("f5", "focus_models", "Models"),
-        ("f6", "focus_credits", "Credits"),
+        ("f2", "focus_tab('question-tab')", "Question"),
+        ("f3", "focus_tab('pattern-tab')", "Patterns"),
+        ("f4", "focus_tab('chat-tab')", "Chats"),
+        ("f5", "focus_tab('model-tab')", "Models"),
+        ("f6", "focus_tab('credits-tab')", "Credits"),
     ]
 
     # Load CSS from external file
@@ -37,15 +138,45 @@ class TabbedTUIApp(App):  # pylint: disable=too-many-instance-attributes
         self.chat_manager = chat_manager
         self.question_processor = question_processor
 
-        # Component instances
+        # TabbedContent widget, looked up once in on_mount
+        self._tabs = None
+
+        # Latest F-key tab request and the timer that applies it, so a burst of
+        # key presses only switches (and lays out) once
+        self._pending_tab = None
+        self._tab_timer = None
+
+        # Component instances, created when their tab is first activated
         self.question_tab = None
         self.pattern_tab = None
         self.chat_tab = None
         self.model_tab = None
         self.credits_tab = None
 
+        # Tab pane id -> mounted component. Components stay mounted once created, so
+        # switching back to a tab shows the existing widgets without re-initializing them
+        self._tab_components = {}
+
+        # Tab pane id -> (attribute name, factory) for the lazily mounted components
+        self._tab_factories = {
+            "pattern-tab": ("pattern_tab", lambda: PatternTab(
+                pattern_manager=self.pattern_manager,
+                id="pattern-component"
+            )),
+            "chat-tab": ("chat_tab", lambda: ChatTab(
+                chat_manager=self.chat_manager,
+                id="chat-component"
+            )),
+            "model-tab": ("model_tab", lambda: ModelTab(id="model-component")),
+            "credits-tab": ("credits_tab", lambda: CreditsTab(id="credits-component")),
+        }
+
     def compose(self):
-        """Compose the main application layout."""
+        """Compose the main application layout.
+
+        Only the initially visible Question Builder is built here, the other
+        tab panes start empty and get their component on first activation.
+        """
         yield Header()
 
         with TabbedContent(initial="question-tab"):
@@ -55,33 +186,13 @@ class TabbedTUIApp(App):  # pylint: disable=too-many-instance-attributes
                     question_processor=self.question_processor,
                     id="question-component"
                 )
+                self._tab_components["question-tab"] = self.question_tab
                 yield self.question_tab
 
-            # Pattern Browser Tab
-            with TabPane("Pattern Browser", id="pattern-tab"):
-                self.pattern_tab = PatternTab(
-                    pattern_manager=self.pattern_manager,
-                    id="pattern-component"
-                )
-                yield self.pattern_tab
-
-            # Chat Browser Tab
-            with TabPane("Chat Browser", id="chat-tab"):
-                self.chat_tab = ChatTab(
-                    chat_manager=self.chat_manager,
-                    id="chat-component"
-                )
-                yield self.chat_tab
-
-            # Model Browser Tab
-            with TabPane("Model Browser", id="model-tab"):
-                self.model_tab = ModelTab(id="model-component")
-                yield self.model_tab
-
-            # Credits Tab
-            with TabPane("Credits", id="credits-tab"):
-                self.credits_tab = CreditsTab(id="credits-component")
-                yield self.credits_tab
+            yield TabPane("Pattern Browser", id="pattern-tab")
+            yield TabPane("Chat Browser", id="chat-tab")
+            yield TabPane("Model Browser", id="model-tab")
+            yield TabPane("Credits", id="credits-tab")
 
         yield Footer()
 
@@ -89,18 +200,46 @@ class TabbedTUIApp(App):  # pylint: disable=too-many-instance-attributes
         """Called when the app mounts."""
         self.title = "AskAI - Interactive Terminal UI"
         self.sub_title = "Question Builder | Pattern Browser | Chat Manager | Model Browser | Credits"
+        self._tabs = self.query_one(TabbedContent)
+
+        # Tab components initialize themselves when mounted (see BaseTabComponent.on_mount)
+        self._schedule_warmup("question-tab")
+
+    async def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Mount the component of a tab the first time it is activated."""
+        tab_id = event.tabbed_content.active
+        await self._mount_tab(tab_id)
+        self._schedule_warmup(tab_id)
+
+    def _schedule_warmup(self, tab_id: str) -> None:
+        """Mount the tab after tab_id in the background so its first activation is instant."""
+        position = TAB_ORDER.index(tab_id) if tab_id in TAB_ORDER else -1
+        if 0 <= position < len(TAB_ORDER) - 1:
+            neighbour = TAB_ORDER[position + 1]
+            if neighbour not in self._tab_components:
+                self.run_worker(self._warm_tab(neighbour), group="tab-warmup", exclusive=False)
+
+    async def _warm_tab(self, tab_id: str) -> None:
+        """Mount a tab ahead of its activation, never letting a failure reach the UI."""
+        try:
+            await self._mount_tab(tab_id)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.log(f"Warming up {tab_id} failed: {e}")
+
+    async def _mount_tab(self, tab_id: str) -> None:
+        """Create and mount the component for a lazily loaded tab.
+
+        Args:
+            tab_id: Id of the TabPane to populate
+        """
+        if tab_id in self._tab_components or tab_id not in self._tab_factories:
+            return
 
-        # Initialize all component tabs
-        if hasattr(self, 'question_tab') and self.question_tab:
-            await self.question_tab.initialize()
-        if hasattr(self, 'pattern_tab') and self.pattern_tab:
-            await self.pattern_tab.initialize()
-        if hasattr(self, 'chat_tab') and self.chat_tab:
-            await self.chat_tab.initialize()
-        if hasattr(self, 'model_tab') and self.model_tab:
-            await self.model_tab.initialize()
-        if hasattr(self, 'credits_tab') and self.credits_tab:
-            await self.credits_tab.initialize()
+        attribute, factory = self._tab_factories[tab_id]
+        component = factory()
+        self._tab_components[tab_id] = component
+        setattr(self, attribute, component)
+        await self.query_one(f"#{tab_id}", TabPane).mount(component)
 
     # Message handlers for component interactions
     async def on_question_tab_question_submitted(self, event) -> None:
@@ -111,112 +250,59 @@ class TabbedTUIApp(App):  # pylint: disable=too-many-instance-attributes
             if not self.question_processor:
                 return
 
-            # Create a simple args object from question_data
-            class SimpleArgs:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
-                """Simple arguments container for question processing."""
-
-                def __init__(self, question_data):
-                    self.question = question_data['question']
-                    self.file_input = question_data['file_input'] if question_data['file_input'] else None
-                    self.url = question_data['url'] if question_data['url'] else None
-                    self.format = question_data['format']
-                    self.model = question_data['model'] if question_data['model'] else None
-                    self.output = None
-                    self.debug = False
-                    # These are not supported in TUI yet, but needed for compatibility
-                    self.image = None
-                    self.pdf = None
-                    self.image_url = None
-                    self.pdf_url = None
-                    self.persistent_chat = None
-
-            args = SimpleArgs(question_data)
-
-            # Process the question
-            response = self.question_processor.process_question(args)
+            args = QuestionArgs(
+                question=question_data['question'],
+                file_input=question_data['file_input'] or None,
+                url=question_data['url'] or None,
+                format=question_data['format'],
+                model=question_data['model'] or None
+            )
 
-            if response and response.content:
-                # Display the answer
-                if self.question_tab:
-                    self.question_tab.display_answer(response.content)
+            # Process the question off the event loop so the UI stays responsive
+            if self.question_tab:
+                self.question_tab.set_busy(True)
+            self._process_question(args)
 
         except Exception as e:
             if self.question_tab:
                 self.question_tab.display_answer(f"Error: {str(e)}")
 
+    @work(thread=True, exclusive=True, group="question")
+    def _process_question(self, args) -> None:
+        """Run the blocking question request in a worker thread."""
+        answer = None
+        try:
+            response = self.question_processor.process_question(args)
+            if response and response.content:
+                answer = response.content
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            answer = f"Error: {str(e)}"
+        self.call_from_thread(self._show_answer, answer)
+
+    def _show_answer(self, answer) -> None:
+        """Display a worker's answer and re-enable the question form."""
+        if self.question_tab:
+            self.question_tab.set_busy(False)
+            if answer:
+                self.question_tab.display_answer(answer)
+
     # Key binding actions
-    def action_focus_question(self) -> None:
-        """Focus the question tab."""
-        tabs = self.query_one(TabbedContent)
-        tabs.active = "question-tab"
-
-    def action_focus_patterns(self) -> None:
-        """Focus the patterns tab."""
-        tabs = self.query_one(TabbedContent)
-        tabs.active = "pattern-tab"
-
-    def action_focus_chats(self) -> None:
-        """Focus the chats tab."""
-        tabs = self.query_one(TabbedContent)
-        tabs.active = "chat-tab"
-
-    def action_focus_models(self) -> None:
-        """Focus the models tab."""
-        tabs = self.query_one(TabbedContent)
-        tabs.active = "model-tab"
-
-    def action_focus_credits(self) -> None:
-        """Focus the credits tab."""
-        tabs = self.query_one(TabbedContent)
-        tabs.active = "credits-tab"
+    def action_focus_tab(self, tab_id: str) -> None:
+        """Switch to the tab with the given pane id, coalescing rapid key presses."""
+        self._pending_tab = tab_id
+        if self._tab_timer is None:
+            self._tab_timer = self.set_timer(TAB_SWITCH_DELAY, self._commit_tab_switch)
+
+    def _commit_tab_switch(self) -> None:
+        """Activate the most recently requested tab."""
+        tab_id, self._pending_tab, self._tab_timer = self._pending_tab, None, None
+        if tab_id is not None:
+            self._tabs.active = tab_id
 
     def action_help(self) -> None:
         """Show help information."""
-        help_text = """
-**AskAI Interactive TUI Help**
-
-**Navigation:**
-• F1: Show this help
-• F2: Switch to Question Builder
-• F3: Switch to Pattern Browser
-• F4: Switch to Chat Browser
-• F5: Switch to Model Browser
-• F6: Switch to Credits
-• Ctrl+Q: Quit application
-
-**Tabs:**
-• Question Builder: Create and submit questions to AI
-• Pattern Browser: Browse and use AI patterns
-• Chat Browser: Manage chat history
-• Model Browser: Browse and select AI models
-• Credits: Monitor OpenRouter credit balance and usage
-
-**Question Builder:**
-• Enter your question in the main text area
-• Optionally add file input, URL, or specify format
-• Click "Ask AI" to submit your question
-• Use "Clear" to reset the form
-
-**Pattern Browser:**
-• Browse available patterns in the left panel
-• Select a pattern to view details in the right panel
-• Provide JSON input if the pattern requires it
-• Click "Use Pattern" to execute
-
-**Chat Browser:**
-• View all your chat sessions
-• Create new chats or delete existing ones
-• Select a chat to view details
-
-**Model Browser:**
-• Browse available AI models
-• Search for specific models
-• View model details, pricing, and capabilities
-• Check your OpenRouter credits
-"""
-
-        # For now, just log the help - in a real implementation you'd create a help screen
-        self.log(help_text)
+        if not isinstance(self.screen, HelpScreen):
+            self.push_screen(HelpScreen())
 
 
 def run_tabbed_tui(pattern_manager=None, chat_manager=None, question_processor=None):
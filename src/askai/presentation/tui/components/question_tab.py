@@ -3,6 +3,7 @@ Question Builder Tab Component.
 Handles the question creation interface with inputs, format selection, and execution.
 """
 
+from textual.css.query import NoMatches
 from textual.widgets import Static, Button, TextArea, Select, Input
 from textual.containers import Vertical, Horizontal, VerticalScroll
 from textual.message import Message
@@ -125,6 +126,13 @@ class QuestionTab(BaseTabComponent):
         format_select.value = "rawtext"
         status_display.update("✅ Form cleared, ready for new question!")
 
+    def set_busy(self, busy: bool) -> None:
+        """Disable the Ask AI button while a question is being processed."""
+        try:
+            self.query_one("#ask-button", Button).disabled = busy
+        except NoMatches:
+            # The tab is not mounted (yet or any more), there is no button to toggle
+            pass
 
     def display_answer(self, answer: str) -> None:
         """Display the AI answer in the answer panel."""
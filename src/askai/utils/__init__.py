@@ -6,7 +6,7 @@ logging setup, and helper functions used across the application.
 """
 
 from .config import load_config
-from .logging import setup_logger, get_logger
+from .logging import setup_logger, get_logger, log_json
 from .helpers import (
     print_error_or_warnings,
     tqdm_spinner,
@@ -14,8 +14,10 @@ from .helpers import (
     get_file_input,
     build_format_instruction,
     encode_file_to_base64,
+    encode_file_to_data_uri,
     run_command,
     safe_json_parse,
+    json_loads,
     format_file_size,
     truncate_string,
     validate_file_extension,
@@ -27,14 +29,17 @@ __all__ = [
     'load_config',
     'setup_logger',
     'get_logger',
+    'log_json',
     'print_error_or_warnings',
     'tqdm_spinner',
     'get_piped_input',
     'get_file_input',
     'build_format_instruction',
     'encode_file_to_base64',
+    'encode_file_to_data_uri',
     'run_command',
     'safe_json_parse',
+    'json_loads',
     'format_file_size',
     'truncate_string',
     'validate_file_extension',
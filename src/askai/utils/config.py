@@ -5,21 +5,37 @@ Supports proper ~/.askai directory structure with initialization and setup wizar
 """
 
 # Standard library imports
+import copy
+import functools
 import os
+import re
 import sys
 import tempfile
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Mapping
 
 # Third-party imports
 import yaml
 
+# Use the libyaml C implementation when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 # ============================================================================
 # CONSTANTS
 # ============================================================================
 
 # Boolean response patterns
-TRUE_VALUES = {'y', 'yes', 'true', '1'}
-FALSE_VALUES = {'n', 'no', 'false', '0'}
+TRUE_VALUES = frozenset({'y', 'yes', 'true', '1'})
+FALSE_VALUES = frozenset({'n', 'no', 'false', '0'})
+
+# Setup wizard indentation per nesting depth
+_INDENTS = tuple("  " * depth for depth in range(16))
+
+# Lowercased answer -> boolean, for a single lookup per prompt answer
+_BOOLEAN_ANSWERS = {**dict.fromkeys(TRUE_VALUES, True), **dict.fromkeys(FALSE_VALUES, False)}
 
 # Placeholder patterns that indicate required fields
 PLACEHOLDER_PATTERNS = [
@@ -32,6 +48,9 @@ PLACEHOLDER_PATTERNS = [
     'replace_this',
 ]
 
+# All placeholder patterns as a single case-insensitive alternation
+_PLACEHOLDER_RE = re.compile("|".join(re.escape(p) for p in PLACEHOLDER_PATTERNS), re.IGNORECASE)
+
 # Default configuration values
 DEFAULT_CONFIG = {
     'log_path': '~/.askai/logs/askai.log',
@@ -50,8 +69,11 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Default TUI features, merged under the configured ones by get_tui_features
+_DEFAULT_TUI_FEATURES = DEFAULT_CONFIG['interface']['tui_features']
+
 # Test configuration values
-TEST_DUMMY_VALUES = {'https://test.api.com', 'test-key', 'test-model'}
+TEST_DUMMY_VALUES = frozenset({'https://test.api.com', 'test-key', 'test-model'})
 
 # Configuration paths
 ASKAI_DIR = os.path.expanduser("~/.askai")
@@ -65,6 +87,12 @@ TEST_CONFIG_PATH = os.path.join(TEST_DIR, "config.yml")
 TEST_CHATS_DIR = os.path.join(TEST_DIR, "chats")
 TEST_LOGS_DIR = os.path.join(TEST_DIR, "logs")
 
+# Config template shipped with the project (config/config_example.yml)
+CONFIG_TEMPLATE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "config", "config_example.yml"
+)
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -87,10 +115,9 @@ def _get_boolean_input(prompt: str, default: bool) -> bool:
         user_input = input(full_prompt).strip().lower()
         if not user_input:
             return default
-        if user_input in TRUE_VALUES:
-            return True
-        if user_input in FALSE_VALUES:
-            return False
+        answer = _BOOLEAN_ANSWERS.get(user_input)
+        if answer is not None:
+            return answer
         print("Please enter y/n")
 
 def _get_numeric_input(prompt: str, default: Any, value_type: type) -> Any:
@@ -148,10 +175,14 @@ def _get_string_input(prompt: str, default: Optional[str] = None,
 # ENVIRONMENT DETECTION
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def is_test_environment() -> bool:
     """
     Check if we're running in a test environment.
 
+    The environment variable is read on the first call and the answer is kept
+    for the rest of the process (use is_test_environment.cache_clear() to re-read).
+
     Returns:
         True if ASKAI_TESTING environment variable is set
     """
@@ -171,17 +202,11 @@ def create_directory_structure(test_mode: bool = False) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    # Only the leaf directories are listed, makedirs creates ASKAI_DIR/TEST_DIR on the way
+    directories = (CHATS_DIR, LOGS_DIR, TEST_CHATS_DIR, TEST_LOGS_DIR) if test_mode else (CHATS_DIR, LOGS_DIR)
     try:
-        # Create main directories
-        os.makedirs(ASKAI_DIR, exist_ok=True)
-        os.makedirs(CHATS_DIR, exist_ok=True)
-        os.makedirs(LOGS_DIR, exist_ok=True)
-
-        if test_mode:
-            # Create test directories
-            os.makedirs(TEST_DIR, exist_ok=True)
-            os.makedirs(TEST_CHATS_DIR, exist_ok=True)
-            os.makedirs(TEST_LOGS_DIR, exist_ok=True)
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
 
         return True
     except Exception as e:
@@ -192,24 +217,29 @@ def create_directory_structure(test_mode: bool = False) -> bool:
 # CONFIGURATION TEMPLATE
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
+def _parse_config_template() -> Optional[Dict[str, Any]]:
+    """
+    Parse the config template once per process; errors are not cached.
+
+    Returns:
+        The parsed template, shared between callers and never modified
+    """
+    if not os.path.exists(CONFIG_TEMPLATE_PATH):
+        raise FileNotFoundError(f"Config template not found at {CONFIG_TEMPLATE_PATH}")
+
+    with open(CONFIG_TEMPLATE_PATH, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 def load_config_template() -> Optional[Dict[str, Any]]:
     """
     Load the config template from config/config_example.yml
 
     Returns:
-        The template configuration with metadata, or None on error
+        A copy of the template configuration with metadata (safe to modify), or None on error
     """
     try:
-        # Get the path to config_example.yml relative to this file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-        template_path = os.path.join(project_root, "config", "config_example.yml")
-
-        if not os.path.exists(template_path):
-            raise FileNotFoundError(f"Config template not found at {template_path}")
-
-        with open(template_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return copy.deepcopy(_parse_config_template())
     except FileNotFoundError as e:
         print(f"Error: {e}")
         return None
@@ -230,21 +260,24 @@ def is_placeholder_value(value: Any) -> bool:
     Returns:
         True if it's a placeholder, False if it's a default
     """
-    if isinstance(value, str):
-        value_lower = value.lower()
-        return any(pattern in value_lower for pattern in PLACEHOLDER_PATTERNS)
-
-    return False
+    return isinstance(value, str) and _PLACEHOLDER_RE.search(value) is not None
 
 # ============================================================================
 # SETUP WIZARD
 # ============================================================================
 
+def _indent(depth: int) -> str:
+    """Return the wizard indentation for a nesting depth."""
+    return _INDENTS[depth] if depth < len(_INDENTS) else "  " * depth
+
 def get_user_input_for_setting(key: str, value: Any, path: str = "",
                                depth: int = 0) -> Any:
     """
     Get user input for a specific configuration setting.
 
+    Nested settings are walked with an explicit stack rather than recursion,
+    prompting for the leaves in template order.
+
     Args:
         key: The configuration key
         value: The current/default value
@@ -254,38 +287,68 @@ def get_user_input_for_setting(key: str, value: Any, path: str = "",
     Returns:
         The user's input or the default value
     """
-    indent = "  " * depth
-    full_key = f"{path}.{key}" if path else key
-
-    # Handle different types of values
-    if isinstance(value, dict):
-        print(f"{indent}[{key.upper()} SETTINGS]")
-        result = {}
-        for sub_key, sub_value in value.items():
-            result[sub_key] = get_user_input_for_setting(sub_key, sub_value, full_key, depth + 1)
-        return result
+    if not isinstance(value, dict):
+        return _get_leaf_input(key, value, depth)
+
+    print(f"{_indent(depth)}[{key.upper()} SETTINGS]")
+    root: Dict[str, Any] = {}
+    # Each entry: (remaining items, dict being filled, dotted path, depth of the items)
+    stack = [(iter(value.items()), root, f"{path}.{key}" if path else key, depth + 1)]
+
+    while stack:
+        items, result, parent_path, level = stack[-1]
+        entry = next(items, None)
+        if entry is None:
+            stack.pop()
+            continue
+
+        sub_key, sub_value = entry
+        if isinstance(sub_value, dict):
+            print(f"{_indent(level)}[{sub_key.upper()} SETTINGS]")
+            nested: Dict[str, Any] = {}
+            result[sub_key] = nested
+            stack.append((iter(sub_value.items()), nested, f"{parent_path}.{sub_key}", level + 1))
+        else:
+            result[sub_key] = _get_leaf_input(sub_key, sub_value, level)
 
-    if isinstance(value, list):
-        # For lists, just return the default for now
-        return value
+    return root
 
-    if value is None:
-        # Handle null values
-        return _get_string_input(f"{indent}{key}", default=None, required=False)
+def _get_leaf_input(key: str, value: Any, depth: int) -> Any:
+    """
+    Get user input for a single non-dict configuration setting.
 
-    if isinstance(value, bool):
-        # Handle boolean values
-        return _get_boolean_input(f"{indent}{key}", default=value)
+    Args:
+        key: The configuration key
+        value: The current/default value
+        depth: The nesting depth, used for indentation
 
-    if isinstance(value, (int, float)):
-        # Handle numeric values
-        return _get_numeric_input(f"{indent}{key}", default=value, value_type=type(value))
+    Returns:
+        The user's input or the default value
+    """
+    handler = _LEAF_HANDLERS.get(type(value), _get_text_leaf)
+    return handler(f"{_indent(depth)}{key}", value)
 
-    # Handle string values
+def _get_text_leaf(prompt: str, value: Any) -> Any:
+    """Prompt for a string setting; placeholder defaults must be replaced."""
     is_required = is_placeholder_value(value)
-    return _get_string_input(f"{indent}{key}", default=None if is_required else value,
+    return _get_string_input(prompt, default=None if is_required else value,
                            required=is_required)
 
+def _get_numeric_leaf(prompt: str, value: Any) -> Any:
+    """Prompt for an int or float setting, keeping the default's type."""
+    return _get_numeric_input(prompt, default=value, value_type=type(value))
+
+# Exact value type -> prompt handler for leaf settings. Lists are kept as-is
+# for now; any other type (strings, YAML dates) is prompted for as text.
+# Keyed on type(value), so bool never reaches the int handler.
+_LEAF_HANDLERS: Dict[type, Callable[[str, Any], Any]] = {
+    list: lambda prompt, value: value,
+    type(None): lambda prompt, value: _get_string_input(prompt, default=None, required=False),
+    bool: lambda prompt, value: _get_boolean_input(prompt, default=value),
+    int: _get_numeric_leaf,
+    float: _get_numeric_leaf,
+}
+
 def _apply_default_paths(template: Dict[str, Any]) -> None:
     """
     Apply default paths to configuration template.
@@ -383,9 +446,9 @@ def create_test_config_from_production() -> bool:
         # Ensure test directory exists
         create_directory_structure(test_mode=True)
 
-        # Load and modify the production config
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        # Load and modify the production config, reusing load_config's parse cache. The
+        # copy keeps the edits below from leaking into the cached production config
+        config = copy.deepcopy(_read_config_file(CONFIG_PATH))
 
         # Modify paths for testing
         if 'log_path' in config:
@@ -400,8 +463,8 @@ def create_test_config_from_production() -> bool:
             config['chat']['storage_path'] = "~/.askai/test/chats"
 
         # Write the modified test config
-        with open(TEST_CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+        with open(TEST_CONFIG_PATH, "w", encoding="utf-8", buffering=1 << 16) as f:
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
         print(f"Test configuration created at {TEST_CONFIG_PATH}")
         print("Modified settings for testing:")
@@ -475,13 +538,22 @@ def _ensure_configuration_file() -> bool:
     Returns:
         True if config exists or was created, False otherwise
     """
-    config_path = TEST_CONFIG_PATH if is_test_environment() else CONFIG_PATH
+    test_environment = is_test_environment()
+    config_path = TEST_CONFIG_PATH if test_environment else CONFIG_PATH
 
-    if os.path.exists(config_path):
+    # One stat covers the common case
+    try:
+        os.stat(config_path)
         return True
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        # e.g. permission denied: the file may exist, so do not run the setup wizard over it
+        print(f"Cannot access configuration file at {config_path}: {e}")
+        return False
 
     # Handle test environment
-    if is_test_environment():
+    if test_environment:
         return _setup_test_configuration()
 
     # Handle production environment
@@ -494,13 +566,18 @@ def _setup_test_configuration() -> bool:
     Returns:
         True if test config was created, False otherwise
     """
-    if os.path.exists(CONFIG_PATH):
-        print("Test configuration not found. Creating automatically from production config...")
-        create_directory_structure(test_mode=True)
-        return create_test_config_from_production()
+    try:
+        os.stat(CONFIG_PATH)
+    except FileNotFoundError:
+        print("Production configuration not found. Please run setup in production mode first.")
+        return False
+    except OSError as e:
+        print(f"Cannot access production configuration at {CONFIG_PATH}: {e}")
+        return False
 
-    print("Production configuration not found. Please run setup in production mode first.")
-    return False
+    print("Test configuration not found. Creating automatically from production config...")
+    create_directory_structure(test_mode=True)
+    return create_test_config_from_production()
 
 def _setup_production_configuration() -> bool:
     """
@@ -517,7 +594,7 @@ def _setup_production_configuration() -> bool:
 
     try:
         with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
         print("Configuration saved successfully!")
         return True
     except IOError as e:
@@ -548,42 +625,64 @@ def _load_test_config() -> Optional[Dict[str, Any]]:
         Configuration dictionary or None if not available
     """
     # First, try to load test configuration if it exists
-    if os.path.exists(TEST_CONFIG_PATH):
-        try:
-            with open(TEST_CONFIG_PATH, "r", encoding="utf-8") as f:
-                test_config = yaml.safe_load(f)
-                # Check if this is a dummy config
-                if (test_config.get('base_url') not in TEST_DUMMY_VALUES and
-                    test_config.get('api_key') not in TEST_DUMMY_VALUES):
-                    return test_config
-        except Exception as e:
-            print(f"Warning: Could not load test config: {e}")
+    try:
+        test_config = _read_config_file(TEST_CONFIG_PATH)
+        # Check if this is a dummy config
+        if (test_config.get('base_url') not in TEST_DUMMY_VALUES and
+            test_config.get('api_key') not in TEST_DUMMY_VALUES):
+            return test_config
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Could not load test config: {e}")
 
     # If test config doesn't exist or has dummy values, check for production config
-    if os.path.exists(CONFIG_PATH):
-        try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                prod_config = yaml.safe_load(f)
-                # Use production config but modify paths for testing
-                temp_dir = tempfile.gettempdir()
-                prod_config['enable_logging'] = False
-                prod_config['log_path'] = os.path.join(temp_dir, 'test.log')
-                prod_config['log_level'] = 'ERROR'
-                if 'chat' in prod_config:
-                    prod_config['chat']['storage_path'] = os.path.join(temp_dir, 'test-chats')
-                if 'interface' in prod_config and 'tui_features' in prod_config['interface']:
-                    prod_config['interface']['tui_features']['enabled'] = False
-                    prod_config['interface']['tui_features']['animations'] = False
-                return prod_config
-        except Exception as e:
-            print(f"Warning: Could not load production config for testing: {e}")
+    try:
+        st = os.stat(CONFIG_PATH)
+        return _test_config_from_production(st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Could not load production config for testing: {e}")
 
     return None
 
+@functools.lru_cache(maxsize=1)
+def _test_config_from_production(mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Adjust a copy of the production configuration for testing.
+
+    Memoized on the production file's modification time and size, so repeated
+    load_config() calls hand out the same object until the file changes.
+
+    Args:
+        mtime_ns: Modification time of the production config in nanoseconds
+        size: Size of the production config in bytes
+
+    Returns:
+        Production configuration with logging, chat storage and TUI adjusted for tests
+    """
+    # Copy before adjusting so the cached production parse stays untouched
+    prod_config = copy.deepcopy(_load_config_cached(CONFIG_PATH, mtime_ns, size))
+    # Use production config but modify paths for testing
+    temp_dir = tempfile.gettempdir()
+    prod_config['enable_logging'] = False
+    prod_config['log_path'] = os.path.join(temp_dir, 'test.log')
+    prod_config['log_level'] = 'ERROR'
+    if 'chat' in prod_config:
+        prod_config['chat']['storage_path'] = os.path.join(temp_dir, 'test-chats')
+    if 'interface' in prod_config and 'tui_features' in prod_config['interface']:
+        prod_config['interface']['tui_features']['enabled'] = False
+        prod_config['interface']['tui_features']['animations'] = False
+    return prod_config
+
+@functools.lru_cache(maxsize=1)
 def _get_minimal_test_config() -> Dict[str, Any]:
     """
     Get minimal test configuration as last resort.
 
+    Built once per process, so repeated load_config() calls return the same object.
+
     Returns:
         Minimal configuration dictionary for testing
     """
@@ -617,10 +716,50 @@ def _get_minimal_test_config() -> Dict[str, Any]:
         }
     }
 
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse the YAML configuration file, memoized on path, modification time and size.
+
+    The mtime and size are part of the cache key so edits to the file are
+    picked up by the next call without explicit invalidation, even on
+    filesystems with coarse timestamps.
+
+    Args:
+        config_path: Path to the configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        The parsed configuration as a dictionary
+    """
+    del mtime_ns, size  # Only used as part of the cache key
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """
+    Return the cached parse of a configuration file, re-reading it when it changed.
+
+    The returned dictionary is shared between callers and must not be modified.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(config_path)
+    return _load_config_cached(config_path, st.st_mtime_ns, st.st_size)
+
+def clear_config_cache() -> None:
+    """Drop all memoized configuration parses (mainly useful for tests)."""
+    _load_config_cached.cache_clear()
+    _test_config_from_production.cache_clear()
+
 def load_config() -> Dict[str, Any]:
     """
     Load and parse the YAML configuration file.
     Automatically ensures setup is complete and uses appropriate config for environment.
+    Parsed results are cached per file modification time and size, so repeated calls
+    within a process do not re-read the file unless it has changed.
 
     Returns:
         The parsed configuration as a dictionary
@@ -641,13 +780,11 @@ def load_config() -> Dict[str, Any]:
 
     config_path = get_config_path()
 
-    if not os.path.exists(config_path):
+    try:
+        return _read_config_file(config_path)
+    except FileNotFoundError:
         print(f"Configuration file not found at {config_path}")
         sys.exit(1)
-
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
     except yaml.YAMLError as e:
         print(f"Error parsing configuration file: {e}")
         sys.exit(1)
@@ -679,7 +816,7 @@ def get_interface_mode(config: Optional[Dict[str, Any]] = None) -> str:
     return config.get('interface', {}).get('default_mode', 'cli')
 
 
-def get_tui_features(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def get_tui_features(config: Optional[Dict[str, Any]] = None) -> Mapping[str, Any]:
     """
     Get TUI feature configuration.
 
@@ -687,17 +824,13 @@ def get_tui_features(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         config: Configuration dict. If None, loads from file.
 
     Returns:
-        TUI features configuration with defaults
+        Read-only mapping of the TUI features, falling back to the defaults for
+        unset keys (copy it with dict() before modifying)
     """
     if config is None:
         config = load_config()
 
-    defaults = DEFAULT_CONFIG['interface']['tui_features'].copy()
-    tui_config = config.get('interface', {}).get('tui_features', {})
-
-    # Merge defaults with user configuration
-    defaults.update(tui_config)
-    return defaults
+    return MappingProxyType({**_DEFAULT_TUI_FEATURES, **config.get('interface', {}).get('tui_features', {})})
 
 
 def is_tui_enabled(config: Optional[Dict[str, Any]] = None) -> bool:
@@ -3,73 +3,165 @@ General utility functions for the Ask AI application.
 Contains core util handling, command execution, and formatting.
 """
 
-import base64
-import itertools
+import functools
 import json
 import os
 import re
 import shlex
-import subprocess
+import stat
 import sys
 import tempfile
-import time
 from html.parser import HTMLParser
-from termcolor import cprint
+from termcolor import colored, cprint
+
+from .config import is_test_environment
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
 
 try:
-    import requests
+    from selectolax.lexbor import LexborHTMLParser
 except ImportError:
-    requests = None
+    LexborHTMLParser = None
+
+# Read size for streamed base64 encoding; a multiple of 3 so only the last chunk is padded
+_BASE64_CHUNK_SIZE = 57 * 1024
+
+# Spinner frames shown by tqdm_spinner, colorized when a spinner starts since
+# termcolor decides on color support (NO_COLOR, tty) at call time
+_SPINNER_COLOR = "light_cyan"
+_SPINNER_FRAMES = tuple(f"\rAI is thinking {char}" for char in "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏")
+
+# Format instructions returned by build_format_instruction
+_JSON_INSTRUCTION = (
+    "\n\n⚠️⚠️⚠️ CRITICAL OUTPUT FORMAT INSTRUCTIONS ⚠️⚠️⚠️\n\n"
+    "Your response MUST be in valid JSON format only.\n\n"
+    "CRITICAL REQUIREMENTS:\n"
+    "1. Return ONLY valid JSON - nothing else\n"
+    "2. DO NOT wrap your response in code blocks or triple backticks\n"
+    "3. DO NOT include any explanation text before or after the JSON\n"
+    "4. The JSON must be properly formatted and valid\n"
+    "5. Structure your JSON response appropriately for the content\n\n"
+    "This is the most important instruction: DO NOT USE ```json or ``` around your response."
+)
+_JSON_INSTRUCTION_HAIKU = _JSON_INSTRUCTION + (
+    "\n\n🚨 EXTRA EMPHASIS FOR CLAUDE-3-HAIKU 🚨\n"
+    "You are Claude-3-Haiku and you MUST follow format instructions precisely.\n"
+    "The user specifically requested JSON format. You MUST respond with ONLY JSON.\n"
+    "Start your response with { and end with }. NO OTHER TEXT ALLOWED.\n"
+    "Example valid response: {\"key\": \"value\"}\n"
+    "Example INVALID response: Here is the JSON: {\"key\": \"value\"}"
+)
+_MARKDOWN_INSTRUCTION = "\n\nIMPORTANT: Format your response using Markdown syntax for better readability."
+
+# Fetched URL bodies are read in chunks of this size and cut off after the maximum
+_URL_READ_CHUNK_SIZE = 64 * 1024
+_MAX_URL_CONTENT_SIZE = 10 * 1024 * 1024
+
+# 19+ digit runs may be integers beyond 64 bits, which orjson turns into floats
+_LONG_DIGITS_RE = re.compile(r'[0-9]{19}')
+_LONG_DIGITS_BYTES_RE = re.compile(rb'[0-9]{19}')
+
+# Units used by format_file_size, each 1024 times the previous one
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Fixed lines around the output fields of generated output format templates
+_FORMAT_TEMPLATE_HEAD = (
+    "You MUST return your response as valid JSON in the following structure:\n"
+    "\n"
+    "{\n"
+    '  "results": {'
+)
+_FORMAT_TEMPLATE_REQUIREMENTS = (
+    "  }\n"
+    "}\n"
+    "\n"
+    "Field requirements:"
+)
+
+# Normalized output type -> JSON type hint in generated output format templates
+_TYPE_HINTS = {
+    'json': '{ ... }',
+    'markdown': '"markdown string"',
+    'text': '"plain text string"',
+    'html': '"HTML string"',
+    'code': '"code string"',
+    'command': '"command string"',
+    'list': '[ ... ]',
+    'table': '[ ... ]'
+}
+
+# Normalized output type -> field requirement; other types use the output description
+_REQUIREMENTS = {
+    'json': "A valid JSON object/array (not a string)",
+    'markdown': "Markdown formatted text with proper headings, lists, and formatting",
+    'command': "Plain command text without backticks, quotes, or markdown formatting",
+    'code': "Plain code without markdown code block wrappers",
+    'html': "Valid HTML without markdown code block wrappers",
+}
+
+# Runs of blank (or whitespace-only) lines in text extracted from HTML
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Elements whose text is not page content
+_HTML_SKIP_TAGS = frozenset({'script', 'style', 'meta', 'link', 'noscript'})
 
 
 class TextExtractor(HTMLParser):
     """HTML parser for extracting text content from web pages."""
 
+    skip_tags = _HTML_SKIP_TAGS
+
     def __init__(self):
         super().__init__()
         self.text_parts = []
-        self.skip_tags = {'script', 'style', 'meta', 'link', 'noscript'}
-        self.current_tag = None
+        # Whether the most recently opened tag is one whose text is skipped
+        self._skip = False
 
     def handle_starttag(self, tag, attrs):
-        self.current_tag = tag.lower()
+        # HTMLParser already lowercases tag names
+        self._skip = tag in self.skip_tags
 
     def handle_endtag(self, tag):
-        self.current_tag = None
+        self._skip = False
 
     def handle_data(self, data):
-        if self.current_tag not in self.skip_tags:
-            text = data.strip()
-            if text:
-                self.text_parts.append(text)
+        if not self._skip and (text := data.strip()):
+            self.text_parts.append(text)
 
 
 def tqdm_spinner(stop_event):
     """Displays a rotating spinner using tqdm."""
-    # Check if we're running in a test environment
-    in_test_env = os.environ.get('ASKAI_TESTING', '').lower() in ('true', '1', 'yes')
-
-    thinking_color = "light_cyan"
     result_color = "green"
 
     # Skip the spinner animation if we're in a test environment
-    if in_test_env:
+    if is_test_environment():
         # In tests, just wait for the stop event without visual updates
         stop_event.wait()
         return
 
     # Display initial thinking message
-    cprint("AI is thinking", thinking_color, end="", flush=True)
-
-    # Create a spinner using itertools.cycle for the characters
-    spinner = itertools.cycle(["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"])
+    cprint("AI is thinking", _SPINNER_COLOR, end="", flush=True)
+    frames = tuple(colored(text, _SPINNER_COLOR) for text in _SPINNER_FRAMES)
 
     # Continue spinning until stop_event is set
     try:
-        while not stop_event.is_set():
+        frame = 0
+        while True:
             # Clear the line and show spinner with message
-            cprint(f"\rAI is thinking {next(spinner)}", thinking_color, end="", flush=True)
-            time.sleep(0.1)  # Control the spinner speed
+            sys.stdout.write(frames[frame])
+            sys.stdout.flush()
+            frame = (frame + 1) % len(frames)
+            # Wakes up as soon as the response arrives rather than after a full tick
+            if stop_event.wait(0.1):
+                break
 
         # Clear the line and show completion message
         cprint(f"\r{' ' * 20}\r", end="", flush=True)  # Clear the spinner line
@@ -167,12 +259,16 @@ def _validate_file_access(file_path):
         return (f"Invalid file path: {e}", None)
 
     # Validate using canonical path - user-controlled but intentional for CLI tool
+    # One stat provides existence, file type and size
     # CodeQL [py/path-injection]: CLI tool - users explicitly specify files to read
-    if not os.path.exists(canonical_path):  # nosec B108
+    try:
+        file_stat = os.stat(canonical_path)  # nosec B108
+    except FileNotFoundError:
         return (f"File not found: {canonical_path}", None)
+    except (OSError, ValueError) as e:
+        return (f"Cannot access file: {canonical_path} ({e})", None)
 
-    # CodeQL [py/path-injection]: CLI tool - canonical path from os.path.realpath() above
-    if not os.path.isfile(canonical_path):  # nosec B108
+    if not stat.S_ISREG(file_stat.st_mode):
         return (f"Path is not a file: {canonical_path}", None)
 
     # CodeQL [py/path-injection]: CLI tool - checking read permissions on validated path
@@ -180,8 +276,7 @@ def _validate_file_access(file_path):
         return (f"File is not readable: {canonical_path}", None)
 
     # Check file size (limit to 100MB for safety)
-    # CodeQL [py/path-injection]: CLI tool - canonical path validated above
-    file_size = os.path.getsize(canonical_path)  # nosec B108
+    file_size = file_stat.st_size
     max_size = 100 * 1024 * 1024  # 100MB
     if file_size > max_size:
         return (f"File too large: {canonical_path} ({file_size} bytes > {max_size} bytes)", None)
@@ -209,7 +304,8 @@ def _read_file_content(canonical_path):
         # Path has already been validated and canonicalized by _validate_file_access()
         # This is intentional CLI behavior - users should access files they have permissions for
         # CodeQL [py/path-injection]: CLI tool - canonical path pre-validated by _validate_file_access
-        with open(canonical_path, "rb") as file:  # nosec B108
+        # Unbuffered: the raw file sizes one bytes object from fstat and reads straight into it
+        with open(canonical_path, "rb", buffering=0) as file:  # nosec B108
             return file.read()
     except Exception as read_error:
         print_error_or_warnings(f"Error reading file {canonical_path}: {read_error}")
@@ -228,40 +324,60 @@ def build_format_instruction(response_format, model_name=None):
         str: The format instruction to add to the AI prompt
     """
     if response_format == "json":
-        instruction = (
-            "\n\n⚠️⚠️⚠️ CRITICAL OUTPUT FORMAT INSTRUCTIONS ⚠️⚠️⚠️\n\n"
-            "Your response MUST be in valid JSON format only.\n\n"
-            "CRITICAL REQUIREMENTS:\n"
-            "1. Return ONLY valid JSON - nothing else\n"
-            "2. DO NOT wrap your response in code blocks or triple backticks\n"
-            "3. DO NOT include any explanation text before or after the JSON\n"
-            "4. The JSON must be properly formatted and valid\n"
-            "5. Structure your JSON response appropriately for the content\n\n"
-            "This is the most important instruction: DO NOT USE ```json or ``` around your response."
-        )
-
         # Add extra emphasis for haiku model which tends to not follow instructions well
-        if model_name and "haiku" in model_name.lower():
-            instruction += (
-                "\n\n🚨 EXTRA EMPHASIS FOR CLAUDE-3-HAIKU 🚨\n"
-                "You are Claude-3-Haiku and you MUST follow format instructions precisely.\n"
-                "The user specifically requested JSON format. You MUST respond with ONLY JSON.\n"
-                "Start your response with { and end with }. NO OTHER TEXT ALLOWED.\n"
-                "Example valid response: {\"key\": \"value\"}\n"
-                "Example INVALID response: Here is the JSON: {\"key\": \"value\"}"
-            )
-
-        return instruction
+        if "haiku" in (model_name or "").lower():
+            return _JSON_INSTRUCTION_HAIKU
+        return _JSON_INSTRUCTION
 
     if response_format == "md":
-        return "\n\nIMPORTANT: Format your response using Markdown syntax for better readability."
+        return _MARKDOWN_INSTRUCTION
     # rawtext (default) - no special formatting instruction needed
     return ""
 
 
+def _encode_file_streamed(canonical_path, prefix=b""):
+    """
+    Base64 encode a validated file in chunks into one preallocated buffer.
+
+    The raw file content and an intermediate base64 string are never held in full.
+
+    Args:
+        canonical_path (str): Already validated canonical path from _validate_file_access()
+        prefix (bytes): ASCII bytes to place before the encoded content
+
+    Returns:
+        str: The prefix followed by the base64 encoded file content
+    """
+    if pybase64 is not None:
+        b64encode = pybase64.b64encode
+    else:
+        import base64  # pylint: disable=import-outside-toplevel
+        b64encode = base64.b64encode
+    file_size = os.path.getsize(canonical_path)  # nosec B108
+
+    buffer = bytearray(len(prefix) + (file_size + 2) // 3 * 4)
+    buffer[:len(prefix)] = prefix
+    position = len(prefix)
+
+    # Reuse one read buffer for every chunk instead of allocating a bytes object per read
+    chunk = bytearray(_BASE64_CHUNK_SIZE)
+    chunk_view = memoryview(chunk)
+
+    # CodeQL [py/path-injection]: CLI tool - canonical path pre-validated by _validate_file_access
+    with open(canonical_path, "rb") as file:  # nosec B108
+        while read_size := file.readinto(chunk):
+            encoded = b64encode(chunk_view[:read_size])
+            buffer[position:position + len(encoded)] = encoded
+            position += len(encoded)
+
+    # The file may have shrunk since it was sized
+    del buffer[position:]
+    return buffer.decode('ascii')
+
+
 def encode_file_to_base64(file_path):
     """
-    Encode a file to base64 format.
+    Encode a file to base64 format, streaming it in chunks.
 
     Args:
         file_path (str): Path to the file to encode
@@ -270,19 +386,48 @@ def encode_file_to_base64(file_path):
         str or None: Base64 encoded string, or None if error
     """
     try:
-        file_content = get_file_input(file_path)
-        if file_content is None:
+        validation_error, canonical_path = _validate_file_access(file_path)
+        if validation_error:
+            print_error_or_warnings(validation_error)
+            return None
+
+        return _encode_file_streamed(canonical_path)
+
+    except Exception as e:
+        print_error_or_warnings(f"Error encoding file to base64: {e}")
+        return None
+
+
+def encode_file_to_data_uri(file_path, media_type):
+    """
+    Encode a file as a base64 data URI, streaming it in chunks.
+
+    Args:
+        file_path (str): Path to the file to encode
+        media_type (str): Media type of the URI, e.g. 'image/png' or 'application/pdf'
+
+    Returns:
+        str or None: 'data:<media_type>;base64,...' string, or None if error
+    """
+    try:
+        validation_error, canonical_path = _validate_file_access(file_path)
+        if validation_error:
+            print_error_or_warnings(validation_error)
             return None
 
-        # Encode to base64
-        encoded_content = base64.b64encode(file_content).decode('utf-8')
-        return encoded_content
+        return _encode_file_streamed(canonical_path, f"data:{media_type};base64,".encode('ascii'))
 
     except Exception as e:
         print_error_or_warnings(f"Error encoding file to base64: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=256)
+def _split_command(command):
+    """Tokenize a command string, memoized for commands that are run repeatedly."""
+    return tuple(shlex.split(command))
+
+
 def run_command(command, capture_output=True, shell=False, timeout=30):
     """
     Execute a shell command safely.
@@ -296,10 +441,13 @@ def run_command(command, capture_output=True, shell=False, timeout=30):
     Returns:
         tuple: (return_code, stdout, stderr)
     """
+    # Imported on use since most invocations never run an external command
+    import subprocess  # pylint: disable=import-outside-toplevel
+
     try:
         if isinstance(command, str) and not shell:
             # Split string command into list for safety
-            command = shlex.split(command)
+            command = list(_split_command(command))
 
         result = subprocess.run(
             command,
@@ -323,18 +471,45 @@ def run_command(command, capture_output=True, shell=False, timeout=30):
         return -1, "", str(e)
 
 
+def json_loads(data):
+    """
+    Parse a JSON document, using orjson when it gives the same result as the json module.
+
+    orjson is skipped for documents with integers that may not fit in 64 bits
+    (it would return lossy floats) and the json module is retried when orjson
+    rejects input it accepts, such as NaN, Infinity, 1e400 or lone surrogates.
+
+    Args:
+        data (str or bytes): JSON document to parse
+
+    Returns:
+        The parsed value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        long_digits = _LONG_DIGITS_BYTES_RE if isinstance(data, (bytes, bytearray)) else _LONG_DIGITS_RE
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
 def safe_json_parse(json_string):
     """
     Safely parse JSON string with error handling.
 
     Args:
-        json_string (str): JSON string to parse
+        json_string (str or bytes): JSON document to parse; bytes are parsed without decoding
 
     Returns:
         dict or None: Parsed JSON object, or None if parsing fails
     """
     try:
-        return json.loads(json_string)
+        return json_loads(json_string)
     except json.JSONDecodeError as e:
         print_error_or_warnings(f"JSON parsing error: {e}", is_warning=True, exit_on_error=False)
         return None
@@ -356,13 +531,12 @@ def format_file_size(size_bytes):
     if not size_bytes:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024.0 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
 
-    return f"{size_bytes:.1f} {size_names[i]}"
+    # Every unit is 2**10 times the previous one, so the bit length picks it directly
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 def truncate_string(text, max_length=100, suffix="..."):
@@ -398,7 +572,8 @@ def validate_file_extension(file_path, allowed_extensions):
         return False
 
     file_ext = os.path.splitext(file_path)[1].lower()
-    return file_ext in [ext.lower() for ext in allowed_extensions]
+    # Stops at the first match without building a lowercased copy of the list
+    return any(file_ext == ext.lower() for ext in allowed_extensions)
 
 
 def create_temp_file(content, suffix="", prefix="askai_"):
@@ -446,20 +621,19 @@ def generate_output_format_template(pattern_outputs):
         return ""
 
     try:
-        # Build a JSON format template based on the expected outputs
-        template_parts = []
-        template_parts.append("You MUST return your response as valid JSON in the following structure:")
-        template_parts.append("")
-        template_parts.append("{")
-        template_parts.append('  "results": {')
+        # Read and normalize each output's attributes once for both sections below
+        outputs = [
+            (
+                getattr(output, 'name', 'unknown'),
+                _normalize_output_type(getattr(output, 'type', 'text')),
+                getattr(output, 'description', '')
+            )
+            for output in pattern_outputs
+        ]
 
         # Add each output field with type hints
         output_fields = []
-        for output in pattern_outputs:
-            output_name = getattr(output, 'name', 'unknown')
-            output_type = getattr(output, 'type', 'text')
-            output_description = getattr(output, 'description', '')
-
+        for output_name, output_type, output_description in outputs:
             # Generate type hint based on output type
             type_hint = _get_type_hint_for_output(output_type)
 
@@ -468,18 +642,10 @@ def generate_output_format_template(pattern_outputs):
                 field_line += f'  // {output_description}'
             output_fields.append(field_line)
 
-        template_parts.append(",\n".join(output_fields))
-        template_parts.append("  }")
-        template_parts.append("}")
-        template_parts.append("")
-
-        # Add specific instructions for each output type
-        template_parts.append("Field requirements:")
-        for output in pattern_outputs:
-            output_name = getattr(output, 'name', 'unknown')
-            output_type = getattr(output, 'type', 'text')
-            output_description = getattr(output, 'description', '')
-
+        # Build a JSON format template based on the expected outputs,
+        # followed by specific instructions for each output type
+        template_parts = [_FORMAT_TEMPLATE_HEAD, ",\n".join(output_fields), _FORMAT_TEMPLATE_REQUIREMENTS]
+        for output_name, output_type, output_description in outputs:
             requirement = _get_requirement_for_output(output_type, output_description)
             if requirement:
                 template_parts.append(f"- {output_name}: {requirement}")
@@ -496,39 +662,87 @@ def generate_output_format_template(pattern_outputs):
         return ""
 
 
+def _normalize_output_type(output_type):
+    """Lowercase an output type given as a string or any other object."""
+    return output_type.lower() if hasattr(output_type, 'lower') else str(output_type).lower()
+
+
 def _get_type_hint_for_output(output_type):
-    """Get JSON type hint for an output type."""
-    type_mapping = {
-        'json': '{ ... }',
-        'markdown': '"markdown string"',
-        'text': '"plain text string"',
-        'html': '"HTML string"',
-        'code': '"code string"',
-        'command': '"command string"',
-        'list': '[ ... ]',
-        'table': '[ ... ]'
-    }
-    return type_mapping.get(
-        output_type.lower() if hasattr(output_type, 'lower') else str(output_type).lower(),
-        '"string"'
-    )
+    """Get JSON type hint for a normalized output type."""
+    return _TYPE_HINTS.get(output_type, '"string"')
 
 
 def _get_requirement_for_output(output_type, description):
-    """Get specific requirement text for an output field."""
-    output_type_str = output_type.lower() if hasattr(output_type, 'lower') else str(output_type).lower()
-
-    if output_type_str == 'json':
-        return "A valid JSON object/array (not a string)"
-    if output_type_str == 'markdown':
-        return "Markdown formatted text with proper headings, lists, and formatting"
-    if output_type_str == 'command':
-        return "Plain command text without backticks, quotes, or markdown formatting"
-    if output_type_str == 'code':
-        return "Plain code without markdown code block wrappers"
-    if output_type_str == 'html':
-        return "Valid HTML without markdown code block wrappers"
-    return description if description else "Plain text content"
+    """Get specific requirement text for an output field of a normalized output type."""
+    return _REQUIREMENTS.get(output_type) or description or "Plain text content"
+
+
+def extract_html_text_parts(html: str) -> list[str]:
+    """
+    Extract the stripped, non-empty text nodes of an HTML document.
+
+    Uses the lexbor-based selectolax parser when installed, falling back to
+    the pure-Python TextExtractor otherwise.
+
+    Args:
+        html: The HTML document
+
+    Returns:
+        Text node contents in document order
+    """
+    if LexborHTMLParser is None:
+        extractor = TextExtractor()
+        extractor.feed(html)
+        return extractor.text_parts
+
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(list(_HTML_SKIP_TAGS))
+    if tree.root is None:
+        return []
+    return [
+        text
+        for node in tree.root.traverse(include_text=True)
+        if node.tag == '-text' and (text := node.text(deep=False).strip())
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_url_session():
+    """
+    Return the HTTP session shared by URL fetches.
+
+    Reusing one session keeps connections (and TLS sessions) alive between fetches.
+    """
+    import requests  # pylint: disable=import-outside-toplevel
+
+    session = requests.Session()
+    # Browser user agent to avoid being blocked
+    session.headers['User-Agent'] = ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+                                     '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+    return session
+
+
+def _read_response_text(response) -> str:
+    """
+    Read and decode a streamed response body, keeping at most _MAX_URL_CONTENT_SIZE bytes.
+
+    Decodes like requests' Response.text, which for text/* responses uses the
+    declared charset or ISO-8859-1.
+    """
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(chunk_size=_URL_READ_CHUNK_SIZE):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= _MAX_URL_CONTENT_SIZE:
+            break
+    body = b''.join(chunks)[:_MAX_URL_CONTENT_SIZE]
+
+    try:
+        return body.decode(response.encoding or 'utf-8', errors='replace')
+    except LookupError:
+        # Unknown encoding declared by the server
+        return body.decode('utf-8', errors='replace')
 
 
 def fetch_url_content(url: str) -> tuple[str | None, str | None]:
@@ -542,38 +756,32 @@ def fetch_url_content(url: str) -> tuple[str | None, str | None]:
         Tuple of (content, error_message). If successful, returns (content, None).
         If failed, returns (None, error_message).
     """
-    if requests is None:
+    # requests takes a good part of the CLI startup time, so it is only imported on first use
+    try:
+        import requests  # pylint: disable=import-outside-toplevel
+    except ImportError:
         return None, "requests library not available"
 
     try:
-        # Add user agent to avoid being blocked
-        headers = {
-            'User-Agent': ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
-                          '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        }
+        # Stream the body so unsupported content is never downloaded and huge pages are capped
+        with _get_url_session().get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()
 
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+            # Check content type
+            content_type = response.headers.get('content-type', '').lower()
+            if 'text/' not in content_type:
+                return None, f"Unsupported content type: {content_type}"
 
-        # Check content type
-        content_type = response.headers.get('content-type', '').lower()
+            text = _read_response_text(response)
 
         if 'text/html' in content_type:
-            # Parse HTML and extract text content
-            extractor = TextExtractor()
-            extractor.feed(response.text)
-
-            # Join text parts and clean up whitespace
-            text = '\n'.join(extractor.text_parts)
+            # Parse HTML, extract text content and join it one node per line
+            text = '\n'.join(extract_html_text_parts(text))
             # Remove excessive whitespace
-            text = re.sub(r'\n\s*\n', '\n\n', text)
+            text = _BLANK_LINES_RE.sub('\n\n', text)
             text = text.strip()
 
-            return text, None
-        if 'text/plain' in content_type or 'text/' in content_type:
-            # Return plain text content
-            return response.text, None
-        return None, f"Unsupported content type: {content_type}"
+        return text, None
 
     except requests.exceptions.RequestException as e:
         return None, f"Failed to fetch URL: {str(e)}"
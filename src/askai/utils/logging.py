@@ -10,6 +10,11 @@ import json
 from typing import Dict, Any
 from logging.handlers import RotatingFileHandler
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Constants for logger configuration
 LOGGER_NAME = 'askai'
 DEFAULT_LOG_PATH = '~/.askai/askai.log'
@@ -97,6 +102,29 @@ def setup_logger(config: Dict[str, Any], debug: bool = False) -> logging.Logger:
     return logger
 
 
+def log_json(logger: logging.Logger, level: int, log_message: str, **fields: Any) -> None:
+    """Log a JSON-formatted entry, serializing only when the level is enabled.
+
+    Args:
+        logger: Logger instance to write to
+        level: Logging level constant (e.g. logging.INFO)
+        log_message: Message stored under the "log_message" key
+        **fields: Additional key/value pairs for the log entry
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, _dumps({"log_message": log_message, **fields}))
+
+
+def _dumps(entry: Dict[str, Any]) -> str:
+    """Serialize a log entry, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which the stdlib encoder handles
+    return json.dumps(entry)
+
+
 def get_logger() -> logging.Logger:
     """Get the configured application logger instance.
 
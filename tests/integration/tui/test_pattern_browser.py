@@ -284,6 +284,13 @@ class TestTUIIntegration(unittest.TestCase):
         self.assertIn('fuzzy_search', features)
         self.assertIn('syntax_highlighting', features)
 
+    def test_tui_config_not_shared(self):
+        """Test that modifying a returned TUI configuration does not affect later calls."""
+        config = get_tui_config()
+        config['features']['live_preview'] = False
+
+        self.assertTrue(get_tui_config()['features']['live_preview'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 """
 Unit tests for OpenRouter API client.
 """
+import json
 import os
 import sys
 from unittest.mock import Mock, patch
@@ -13,7 +14,8 @@ sys.path.insert(0, os.path.join(project_root, "tests"))
 
 # pylint: disable=wrong-import-position,import-error
 from unit.test_base import BaseUnitTest
-from askai.core.ai.openrouter import OpenRouterClient
+from askai.core.ai.openrouter import OpenRouterClient, _decode_response
+from askai.core.ai.models import ModelConfiguration
 
 
 class TestOpenRouterClient(BaseUnitTest):
@@ -24,7 +26,10 @@ class TestOpenRouterClient(BaseUnitTest):
         self.test_client_initialization()
         self.test_get_headers()
         self.test_configure_model_settings()
+        self.test_configure_model_settings_from_configuration()
         self.test_detect_content_types()
+        self.test_handle_api_response()
+        self.test_decode_response_big_integers()
         return self.results
 
     def test_client_initialization(self):
@@ -133,6 +138,40 @@ class TestOpenRouterClient(BaseUnitTest):
                 f"Model configuration failed: {str(e)}"
             )
 
+    def test_configure_model_settings_from_configuration(self):
+        """Test model settings taken from a ModelConfiguration instance."""
+        try:
+            mock_config = {
+                'api_key': 'test-key',
+                'base_url': 'https://openrouter.ai/api/v1'
+            }
+
+            model_config = ModelConfiguration(
+                provider="openrouter",
+                model_name="anthropic/claude-3-sonnet",
+                temperature=0.2,
+                stop_sequences=["STOP"]
+            )
+
+            with patch('askai.utils.config.load_config', return_value=mock_config):
+                client = OpenRouterClient(config=mock_config)
+                # pylint: disable=protected-access
+                result = client._configure_model_settings({}, model_config)
+
+                self.assert_equal(
+                    {"model": "anthropic/claude-3-sonnet", "temperature": 0.2, "stop": ["STOP"]},
+                    result,
+                    "openrouter_model_settings_from_configuration",
+                    "Settings come from the precomputed request settings, unset values omitted"
+                )
+
+        except Exception as e:
+            self.add_result(
+                "openrouter_configure_model_from_configuration",
+                False,
+                f"Model configuration from ModelConfiguration failed: {str(e)}"
+            )
+
     def test_detect_content_types(self):
         """Test content type detection."""
         try:
@@ -172,6 +211,67 @@ class TestOpenRouterClient(BaseUnitTest):
                 f"Content type detection failed: {str(e)}"
             )
 
+    def test_handle_api_response(self):
+        """Test parsing of a successful completion response body."""
+        try:
+            mock_config = {
+                'api_key': 'test-key',
+                'base_url': 'https://openrouter.ai/api/v1'
+            }
+
+            response = Mock()
+            response.ok = True
+            body = '{"choices": [{"message": {"content": "Grüezi"}}]}'
+            response.content = body.encode('utf-8')
+            response.json.return_value = json.loads(body)
+
+            with patch('askai.utils.config.load_config', return_value=mock_config):
+                client = OpenRouterClient(config=mock_config)
+                # pylint: disable=protected-access
+                result = client._handle_api_response(response, Mock(), {"has_pdf": False})
+
+                self.assert_equal(
+                    "Grüezi",
+                    result["content"],
+                    "openrouter_handle_response_content",
+                    "Message content is extracted from the response body"
+                )
+
+        except Exception as e:
+            self.add_result(
+                "openrouter_handle_response",
+                False,
+                f"API response handling failed: {str(e)}"
+            )
+
+    def test_decode_response_big_integers(self):
+        """Test that integers wider than 64 bits in a response body keep their exact value."""
+        try:
+            response = Mock()
+            response.content = b'{"id": 123456789012345678901234567890, "usage": {"cost": NaN}}'
+
+            result = _decode_response(response)
+
+            self.assert_equal(
+                123456789012345678901234567890,
+                result["id"],
+                "openrouter_decode_big_int",
+                "Big integers are not turned into floats"
+            )
+            self.assert_true(
+                result["usage"]["cost"] != result["usage"]["cost"],
+                "openrouter_decode_nan",
+                "NaN is accepted like the json module does"
+            )
+            response.json.assert_not_called()
+
+        except Exception as e:
+            self.add_result(
+                "openrouter_decode_big_int",
+                False,
+                f"Response decoding failed: {str(e)}"
+            )
+
 
 if __name__ == "__main__":
     test_suite = TestOpenRouterClient()
@@ -25,6 +25,8 @@ class TestAIService(BaseUnitTest):
         self.test_get_ai_response_success()
         self.test_get_ai_response_failure()
         self.test_model_configuration()
+        self.test_client_reused_for_same_config()
+        self.test_model_selection_logged_when_cached()
         return self.results
 
     def test_ai_service_initialization(self):
@@ -161,3 +163,55 @@ class TestAIService(BaseUnitTest):
 
         except Exception as e:
             self.add_result("model_configuration_error", False, f"Model configuration test failed: {e}")
+
+    def test_model_selection_logged_when_cached(self):
+        """Test that a cached model configuration logs the same selection as a freshly built one."""
+        try:
+            mock_logger = Mock()
+            ai_service = AIService(mock_logger)
+            config = {'default_model': 'test-model', 'base_url': 'https://example.com/', 'api_key': 'x'}
+
+            first = ai_service.get_model_configuration('cli-model', config)
+            first_logs = list(mock_logger.log.call_args_list)
+            mock_logger.log.reset_mock()
+            second = ai_service.get_model_configuration('cli-model', config)
+
+            self.assert_true(first is second, "model_config_cached", "Model configuration is reused")
+            self.assert_equal(
+                first_logs,
+                list(mock_logger.log.call_args_list),
+                "model_config_cached_logs",
+                "Cached lookups log the same model selection"
+            )
+
+            ai_service.close()
+
+        except Exception as e:
+            self.add_result("model_selection_logged_error", False, f"Model selection log test failed: {e}")
+
+    def test_client_reused_for_same_config(self):
+        """Test that the OpenRouter client is pooled while the config object is unchanged."""
+        try:
+            mock_logger = Mock()
+            ai_service = AIService(mock_logger)
+            config = {'default_model': 'test-model', 'base_url': 'https://example.com/', 'api_key': 'x'}
+            messages = [{'role': 'user', 'content': 'Test question'}]
+
+            with patch('askai.core.ai.service.load_config', return_value=config), \
+                 patch('askai.core.ai.service.OpenRouterClient') as mock_client_class:
+                mock_client_class.return_value.request_completion.return_value = {'content': 'ok'}
+
+                ai_service.get_ai_response(messages=messages)
+                ai_service.get_ai_response(messages=messages)
+
+                self.assert_equal(
+                    1,
+                    mock_client_class.call_count,
+                    "ai_service_client_reused",
+                    "OpenRouter client is created once for repeated requests"
+                )
+
+            ai_service.close()
+
+        except Exception as e:
+            self.add_result("ai_service_client_reuse_error", False, f"Client reuse test failed: {e}")
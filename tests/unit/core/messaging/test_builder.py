@@ -3,6 +3,7 @@ Unit tests for messaging module - comprehensive coverage with mocking.
 """
 import os
 import sys
+import tempfile
 from unittest.mock import Mock, patch, mock_open
 
 # Setup paths for imports
@@ -29,8 +30,45 @@ class TestMessageBuilder(BaseUnitTest):
         self.test_pattern_message_creation()
         self.test_message_formatting()
         self.test_error_handling()
+        self.test_encoding_reused_within_call()
         return self.results
 
+    def test_encoding_reused_within_call(self):
+        """Test that a file passed as image and as pattern input is encoded once and not kept afterwards."""
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                image_path = os.path.join(tmp_dir, "photo.png")
+                with open(image_path, "wb") as f:
+                    f.write(b"\x89PNG\r\n\x1a\n" + b"\0" * 64)
+
+                image_input = Mock()
+                image_input.name = "photo"
+                image_input.input_type.value = "image_file"
+                mock_pattern_mgr = Mock()
+                mock_pattern_mgr.get_pattern_content.return_value = {
+                    "prompt_content": "Describe the photo",
+                    "inputs": [image_input]
+                }
+                mock_pattern_mgr.process_pattern_inputs.return_value = {"photo": image_path}
+
+                builder = MessageBuilder(mock_pattern_mgr, Mock())
+                with patch('askai.core.messaging.builder.get_piped_input', return_value=None), \
+                     patch('askai.core.messaging.builder.encode_file_to_data_uri',
+                           return_value="data:image/png;base64,AAAA") as mock_encode:
+                    messages, _ = builder.build_messages(
+                        pattern_id="photo_pattern", image=image_path
+                    )
+
+                self.assert_equal(1, mock_encode.call_count, "encoding_reused_once",
+                                  "File used as image and pattern input is encoded once")
+                self.assert_equal(2, sum(1 for m in messages or [] if isinstance(m["content"], list)),
+                                  "encoding_reused_messages", "Both image messages are built")
+                self.assert_equal({}, builder._encodings,  # pylint: disable=protected-access
+                                  "encoding_cache_cleared", "No encodings are kept after the call")
+
+        except Exception as e:
+            self.add_result("encoding_reused_error", False, f"Encoding reuse test failed: {e}")
+
     def test_message_builder_initialization(self):
         """Test message builder initializes properly."""
         try:
@@ -29,6 +29,7 @@ class TestPatternConfiguration(BaseUnitTest):
         self.test_model_configuration()
         self.test_model_configuration_from_dict()
         self.test_model_configuration_web_search()
+        self.test_model_configuration_hashable()
         self.test_pattern_purpose()
         self.test_pattern_functionality()
         self.test_pattern_configuration()
@@ -181,6 +182,54 @@ class TestPatternConfiguration(BaseUnitTest):
                 f"ModelConfiguration web search test failed: {str(e)}"
             )
 
+    def test_model_configuration_hashable(self):
+        """Test that ModelConfiguration is immutable and usable as a cache key."""
+        try:
+            first = ModelConfiguration(
+                provider="openrouter",
+                model_name="test-model",
+                stop_sequences=["END"],
+                custom_parameters={"top_p": 0.9}
+            )
+            second = ModelConfiguration.from_dict({
+                "model_name": "test-model",
+                "stop_sequences": ["END"],
+                "custom_parameters": {"top_p": 0.9}
+            })
+
+            self.assert_equal(
+                ("END",),
+                first.stop_sequences,
+                "model_config_stop_sequences_tuple",
+                "Stop sequences are normalized to a tuple"
+            )
+
+            self.assert_equal(
+                1,
+                len({first, second}),
+                "model_config_hashable",
+                "Equal configurations hash to the same set entry"
+            )
+
+            try:
+                first.temperature = 0.1  # type: ignore[misc]
+                frozen = False
+            except AttributeError:
+                frozen = True
+
+            self.assert_true(
+                frozen,
+                "model_config_frozen",
+                "ModelConfiguration rejects attribute assignment"
+            )
+
+        except Exception as e:
+            self.add_result(
+                "model_configuration_hashable",
+                False,
+                f"ModelConfiguration hashing test failed: {str(e)}"
+            )
+
     def test_pattern_purpose(self):
         """Test PatternPurpose creation."""
         try:
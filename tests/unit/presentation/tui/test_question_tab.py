@@ -0,0 +1,31 @@
+"""
+Unit tests for the question builder tab.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from askai.presentation.tui.components.question_tab import QuestionTab
+
+
+class TestQuestionTabBusy(unittest.TestCase):
+    """Test toggling the busy state of the question tab."""
+
+    def test_set_busy_unmounted(self):
+        """Test that an unmounted tab ignores busy state changes."""
+        tab = QuestionTab()
+
+        tab.set_busy(True)
+        tab.set_busy(False)
+
+    def test_set_busy_unexpected_error(self):
+        """Test that errors other than a missing button are not swallowed."""
+        tab = QuestionTab()
+
+        with patch.object(QuestionTab, 'query_one', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                tab.set_busy(True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,8 @@ any interference with real configuration files.
 """
 import os
 import sys
+import tempfile
+from unittest.mock import patch
 
 # Setup paths for imports
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
@@ -138,3 +140,109 @@ class TestConfigLoaderSafe(BaseUnitTest):
                 False,
                 f"Cannot import load_config function: {e}"
             )
+
+
+class TestTestConfigFromProduction(BaseUnitTest):
+    """Test the test-mode copy of a production config using a temporary config file."""
+
+    def run(self):
+        """Run test config tests."""
+        self.test_copy_is_stable()
+        return self.results
+
+    def test_copy_is_stable(self):
+        """Test that the adjusted copy is reused until the file changes and leaves the parse untouched."""
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, "config.yml")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("api_key: abc\nenable_logging: true\n")
+                st = os.stat(path)
+
+                with patch.object(shared_config, 'CONFIG_PATH', path):
+                    shared_config.clear_config_cache()
+                    # pylint: disable=protected-access
+                    first = shared_config._test_config_from_production(st.st_mtime_ns, st.st_size)
+                    second = shared_config._test_config_from_production(st.st_mtime_ns, st.st_size)
+                    parsed = shared_config._read_config_file(path)
+
+                self.assert_true(first is second, "test_config_stable",
+                                 "Repeated loads return the same object")
+                self.assert_equal(False, first['enable_logging'], "test_config_adjusted",
+                                  "Logging is disabled in the test copy")
+                self.assert_equal(True, parsed['enable_logging'], "test_config_parse_untouched",
+                                  "The cached production parse is not modified")
+        except Exception as e:
+            self.add_result("test_config_copy_is_stable", False, f"Test config error: {e}")
+        finally:
+            shared_config.clear_config_cache()
+
+
+class TestEnsureConfigurationFile(BaseUnitTest):
+    """Test the configuration file check without touching real configuration files."""
+
+    def run(self):
+        """Run configuration file check tests."""
+        self.test_unreadable_config_does_not_start_setup()
+        return self.results
+
+    def test_unreadable_config_does_not_start_setup(self):
+        """Test that an OSError other than a missing file is reported instead of raised or set up over."""
+        try:
+            with patch.object(shared_config.os, 'stat', side_effect=PermissionError("denied")), \
+                 patch.object(shared_config, '_setup_test_configuration') as setup_test, \
+                 patch.object(shared_config, '_setup_production_configuration') as setup_production, \
+                 patch('builtins.print'):
+                # pylint: disable=protected-access
+                result = shared_config._ensure_configuration_file()
+
+            self.assert_equal(False, result, "ensure_config_unreadable",
+                              "Unreadable configuration is reported as not set up")
+            self.assert_true(not setup_test.called and not setup_production.called,
+                             "ensure_config_unreadable_no_setup", "Setup is not started over an existing file")
+        except Exception as e:
+            self.add_result("ensure_config_unreadable", False, f"Configuration check error: {e}")
+
+
+class TestTuiFeatures(BaseUnitTest):
+    """Test TUI feature lookups against explicit config dicts."""
+
+    def run(self):
+        """Run TUI feature tests."""
+        self.test_defaults_merged()
+        self.test_config_not_modified()
+        return self.results
+
+    def test_defaults_merged(self):
+        """Test that configured features override the defaults and unset ones fall back."""
+        try:
+            features = shared_config.get_tui_features({'interface': {'tui_features': {'enabled': False}}})
+            self.assert_equal(False, features['enabled'], "tui_features_override",
+                              "Configured feature overrides the default")
+            self.assert_equal(shared_config.DEFAULT_CONFIG['interface']['tui_features']['auto_fallback'],
+                              features['auto_fallback'], "tui_features_default",
+                              "Unset feature falls back to the default")
+        except Exception as e:
+            self.add_result("tui_features_defaults_merged", False, f"TUI features error: {e}")
+
+    def test_config_not_modified(self):
+        """Test that the returned features cannot write into the config or the defaults."""
+        try:
+            config = {'interface': {'tui_features': {'enabled': True}}}
+            features = shared_config.get_tui_features(config)
+
+            def write_feature():
+                features['enabled'] = False  # type: ignore[index]
+
+            self.assert_raises(TypeError, write_feature,
+                               "tui_features_read_only", "Returned features are read-only")
+
+            features = dict(features)
+            features['auto_fallback'] = 'changed'
+            self.assert_equal({'enabled': True}, config['interface']['tui_features'],
+                              "tui_features_config_untouched", "Config dict is not modified")
+            self.assert_true(
+                shared_config.DEFAULT_CONFIG['interface']['tui_features']['auto_fallback'] != 'changed',
+                "tui_features_defaults_untouched", "Default features are not modified")
+        except Exception as e:
+            self.add_result("tui_features_config_not_modified", False, f"TUI features error: {e}")
@@ -1,9 +1,13 @@
 """
 Unit tests for shared utilities - comprehensive coverage with mocking.
 """
+import base64
+import json
+import math
 import os
 import sys
-from unittest.mock import Mock, patch
+import tempfile
+from unittest.mock import MagicMock, Mock, patch
 
 # Setup paths for imports
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
@@ -14,6 +18,7 @@ sys.path.insert(0, os.path.join(project_root, "tests"))
 # pylint: disable=wrong-import-position,import-error
 from unit.test_base import BaseUnitTest
 import askai.utils as shared_utils
+from askai.utils import helpers
 
 # Alias for convenience
 print_error_or_warnings = shared_utils.print_error_or_warnings
@@ -198,8 +203,25 @@ class TestFileUtilities(BaseUnitTest):
         self.test_file_existence_check()
         self.test_directory_operations()
         self.test_path_manipulation()
+        self.test_encode_file_to_data_uri()
+        self.test_encode_file_to_base64()
+        self.test_validate_file_extension()
         return self.results
 
+    def test_validate_file_extension(self):
+        """Test extension validation with list, generator and mixed-case inputs."""
+        try:
+            self.assert_true(shared_utils.validate_file_extension("photo.JPG", ['.png', '.Jpg']),
+                             "validate_extension_case", "Extensions are compared case-insensitively")
+            self.assert_true(shared_utils.validate_file_extension("doc.pdf", (ext for ext in ['.pdf'])),
+                             "validate_extension_iterable", "Any iterable of extensions is accepted")
+            self.assert_true(not shared_utils.validate_file_extension("notes.txt", ['.pdf']),
+                             "validate_extension_rejected", "Other extensions are rejected")
+            self.assert_true(not shared_utils.validate_file_extension("", ['.pdf']),
+                             "validate_extension_empty", "Empty paths are rejected")
+        except Exception as e:
+            self.add_result("validate_extension_error", False, f"Extension validation failed: {e}")
+
     def test_file_existence_check(self):
         """Test file existence checking with mocked filesystem."""
         try:
@@ -272,3 +294,218 @@ class TestFileUtilities(BaseUnitTest):
 
         except Exception as e:
             self.add_result("path_manipulation_error", False, f"Path manipulation failed: {e}")
+
+    def test_encode_file_to_data_uri(self):
+        """Test streamed data URI encoding across chunk boundaries."""
+        try:
+            # Larger than one read chunk and not a multiple of 3, so the tail is padded
+            content = bytes(range(256)) * 300 + b"tail"
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+                tmp.write(content)
+                tmp_path = tmp.name
+
+            try:
+                data_uri = shared_utils.encode_file_to_data_uri(tmp_path, "application/pdf")
+            finally:
+                os.unlink(tmp_path)
+
+            self.assert_equal(
+                "data:application/pdf;base64," + base64.b64encode(content).decode("ascii"),
+                data_uri,
+                "encode_data_uri_content",
+                "Streamed data URI matches a one-shot base64 encoding"
+            )
+
+        except Exception as e:
+            self.add_result("encode_data_uri_error", False, f"Data URI encoding failed: {e}")
+
+    def test_encode_file_to_base64(self):
+        """Test streamed base64 encoding of a file spanning several chunks."""
+        try:
+            content = bytes(range(256)) * 300 + b"odd"
+            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
+                tmp.write(content)
+                tmp_path = tmp.name
+
+            try:
+                encoded = shared_utils.encode_file_to_base64(tmp_path)
+            finally:
+                os.unlink(tmp_path)
+
+            self.assert_equal(
+                base64.b64encode(content).decode("ascii"),
+                encoded,
+                "encode_base64_content",
+                "Streamed base64 matches a one-shot encoding"
+            )
+
+        except Exception as e:
+            self.add_result("encode_base64_error", False, f"Base64 encoding failed: {e}")
+
+
+class TestHtmlTextExtraction(BaseUnitTest):
+    """Test text extraction from HTML documents."""
+
+    SAMPLE_HTML = (
+        "<html><head><title> Title </title><style>p { color: red; }</style>"
+        "<meta charset='utf-8'></head><body><p>Hello <b>world</b>\n  \n</p>"
+        "<script>var a = 1;</script><noscript>Enable JS</noscript><div>  </div>"
+        "<p>Fish &amp; chips</p></body></html>"
+    )
+    EXPECTED_PARTS = ["Title", "Hello", "world", "Fish & chips"]
+
+    def run(self):
+        """Run HTML text extraction tests."""
+        self.test_extract_html_text_parts()
+        self.test_extract_html_text_parts_fallback()
+        self.test_fetch_url_content_html()
+        self.test_fetch_url_content_size_cap()
+        self.test_fetch_url_content_unsupported_type()
+        return self.results
+
+    def _mock_response(self, content_type, body, encoding='utf-8'):
+        """Build a mocked streamed requests response."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.headers = {'content-type': content_type}
+        response.encoding = encoding
+        response.iter_content.side_effect = lambda chunk_size: (
+            body[i:i + chunk_size] for i in range(0, len(body), chunk_size)
+        )
+        return response
+
+    def test_extract_html_text_parts(self):
+        """Test extraction with the parser available in this environment."""
+        try:
+            self.assert_equal(
+                self.EXPECTED_PARTS,
+                helpers.extract_html_text_parts(self.SAMPLE_HTML),
+                "html_text_parts",
+                "Text nodes are stripped and script/style content is skipped"
+            )
+        except Exception as e:
+            self.add_result("html_text_parts_error", False, f"HTML text extraction failed: {e}")
+
+    def test_extract_html_text_parts_fallback(self):
+        """Test extraction with the pure-Python TextExtractor."""
+        try:
+            with patch.object(helpers, 'LexborHTMLParser', None):
+                parts = helpers.extract_html_text_parts(self.SAMPLE_HTML)
+            self.assert_equal(
+                self.EXPECTED_PARTS,
+                parts,
+                "html_text_parts_fallback",
+                "TextExtractor fallback yields the same text parts"
+            )
+        except Exception as e:
+            self.add_result("html_text_parts_fallback_error", False, f"HTML text extraction failed: {e}")
+
+    def test_fetch_url_content_html(self):
+        """Test that fetched HTML is reduced to its text."""
+        try:
+            response = self._mock_response('text/html; charset=utf-8', self.SAMPLE_HTML.encode('utf-8'))
+            with patch.object(helpers, '_get_url_session') as mock_session:
+                mock_get = mock_session.return_value.get
+                mock_get.return_value = response
+                content, error = helpers.fetch_url_content("https://example.com")
+
+            self.assert_equal(None, error, "fetch_url_html_no_error", "HTML page is fetched without error")
+            self.assert_equal("\n".join(self.EXPECTED_PARTS), content, "fetch_url_html_text",
+                              "HTML page is reduced to its text nodes")
+            self.assert_true(mock_get.call_args.kwargs.get('stream'), "fetch_url_streamed",
+                             "Response body is streamed")
+        except Exception as e:
+            self.add_result("fetch_url_html_error", False, f"URL fetch failed: {e}")
+
+    def test_fetch_url_content_size_cap(self):
+        """Test that oversized bodies are cut off at the maximum size."""
+        try:
+            limit = helpers._MAX_URL_CONTENT_SIZE  # pylint: disable=protected-access
+            response = self._mock_response('text/plain', b"x" * (limit + 100000))
+            with patch.object(helpers, '_get_url_session') as mock_session:
+                mock_session.return_value.get.return_value = response
+                content, _ = helpers.fetch_url_content("https://example.com/big.txt")
+
+            self.assert_equal(limit, len(content), "fetch_url_size_cap", "Body is capped at the maximum size")
+        except Exception as e:
+            self.add_result("fetch_url_size_cap_error", False, f"URL fetch failed: {e}")
+
+    def test_fetch_url_content_unsupported_type(self):
+        """Test that non-text responses are rejected without reading the body."""
+        try:
+            response = self._mock_response('application/pdf', b"%PDF-1.7")
+            with patch.object(helpers, '_get_url_session') as mock_session:
+                mock_session.return_value.get.return_value = response
+                content, error = helpers.fetch_url_content("https://example.com/doc.pdf")
+
+            self.assert_equal(None, content, "fetch_url_unsupported_content", "No content for binary types")
+            self.assert_equal("Unsupported content type: application/pdf", error,
+                              "fetch_url_unsupported_error", "Unsupported type is reported")
+            self.assert_false(response.iter_content.called, "fetch_url_unsupported_not_read",
+                              "Body of an unsupported type is not downloaded")
+        except Exception as e:
+            self.add_result("fetch_url_unsupported_error", False, f"URL fetch failed: {e}")
+
+
+class TestJsonLoads(BaseUnitTest):
+    """Test that json_loads matches the json module on inputs orjson handles differently."""
+
+    def run(self):
+        """Run json_loads tests."""
+        self.test_big_integers_keep_precision()
+        self.test_non_standard_values_fall_back()
+        self.test_bytes_input()
+        self.test_invalid_json_raises()
+        self.test_safe_json_parse_matches_json_module()
+        return self.results
+
+    def test_big_integers_keep_precision(self):
+        """Test that integers wider than 64 bits are not turned into floats."""
+        try:
+            payload = '{"results": {"id": 123456789012345678901234567890, "neg": -9223372036854775809}}'
+            self.assert_equal(
+                json.loads(payload),
+                shared_utils.json_loads(payload),
+                "json_loads_big_int",
+                "Big integers keep their exact value"
+            )
+        except Exception as e:
+            self.add_result("json_loads_big_int_error", False, f"json_loads failed: {e}")
+
+    def test_non_standard_values_fall_back(self):
+        """Test NaN, Infinity, out-of-range floats and lone surrogates."""
+        try:
+            parsed = shared_utils.json_loads('{"a": NaN, "b": Infinity, "c": 1e400, "d": "\\ud800"}')
+            self.assert_true(math.isnan(parsed["a"]), "json_loads_nan", "NaN is accepted")
+            self.assert_equal(math.inf, parsed["b"], "json_loads_infinity", "Infinity is accepted")
+            self.assert_equal(math.inf, parsed["c"], "json_loads_overflow", "1e400 parses as infinity")
+            # Compared via assert_true, the report cannot print a lone surrogate
+            self.assert_true(parsed["d"] == "\ud800", "json_loads_surrogate", "Lone surrogates are accepted")
+        except Exception as e:
+            self.add_result("json_loads_fallback_error", False, f"json_loads failed: {e}")
+
+    def test_bytes_input(self):
+        """Test that bytes are parsed without decoding first."""
+        try:
+            self.assert_equal({"a": [1, 2]}, shared_utils.json_loads(b'{"a": [1, 2]}'),
+                              "json_loads_bytes", "Bytes input is parsed")
+            self.assert_equal({"n": 12345678901234567890123}, shared_utils.json_loads(b'{"n": 12345678901234567890123}'),
+                              "json_loads_bytes_big_int", "Big integers in bytes keep their exact value")
+        except Exception as e:
+            self.add_result("json_loads_bytes_error", False, f"json_loads failed: {e}")
+
+    def test_invalid_json_raises(self):
+        """Test that invalid documents raise json.JSONDecodeError."""
+        self.assert_raises(json.JSONDecodeError, lambda: shared_utils.json_loads("{bad"),
+                           "json_loads_invalid", "Invalid JSON raises JSONDecodeError")
+
+    def test_safe_json_parse_matches_json_module(self):
+        """Test that safe_json_parse accepts NaN and keeps big integers exact."""
+        try:
+            parsed = shared_utils.safe_json_parse('{"score": NaN, "id": 123456789012345678901234567890}')
+            self.assert_true(parsed is not None and math.isnan(parsed["score"]),
+                             "safe_json_parse_nan", "NaN is accepted")
+            self.assert_equal(123456789012345678901234567890, parsed["id"] if parsed else None,
+                              "safe_json_parse_big_int", "Big integers keep their exact value")
+        except Exception as e:
+            self.add_result("safe_json_parse_error", False, f"safe_json_parse failed: {e}")
@@ -3,8 +3,10 @@ Unit tests for logging module.
 """
 import os
 import sys
+import json
 import tempfile
 import logging
+from unittest.mock import Mock
 
 # Setup paths for imports
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
@@ -19,6 +21,7 @@ from askai.utils.logging import (
     get_logger,
     get_log_level,
     create_log_directory,
+    log_json,
     LOGGER_NAME
 )
 
@@ -34,6 +37,7 @@ class TestLogging(BaseUnitTest):
         self.test_setup_logger_debug_mode()
         self.test_setup_logger_disabled()
         self.test_get_logger()
+        self.test_log_json()
         return self.results
 
     def test_get_log_level(self):
@@ -226,6 +230,47 @@ class TestLogging(BaseUnitTest):
                 f"Getting logger failed: {str(e)}"
             )
 
+    def test_log_json(self):
+        """Test JSON log helper only serializes enabled levels."""
+        try:
+            logger = Mock()
+            logger.isEnabledFor.return_value = True
+
+            log_json(logger, logging.INFO, "Test message", model="test-model")
+
+            level, message = logger.log.call_args[0]
+            self.assert_equal(
+                logging.INFO,
+                level,
+                "log_json_level",
+                "log_json logs at the requested level"
+            )
+
+            self.assert_equal(
+                {"log_message": "Test message", "model": "test-model"},
+                json.loads(message),
+                "log_json_payload",
+                "log_json writes the message and fields as JSON"
+            )
+
+            logger = Mock()
+            logger.isEnabledFor.return_value = False
+
+            log_json(logger, logging.DEBUG, "Filtered message")
+
+            self.assert_false(
+                logger.log.called,
+                "log_json_disabled_level",
+                "log_json skips disabled levels"
+            )
+
+        except Exception as e:
+            self.add_result(
+                "log_json",
+                False,
+                f"JSON log helper failed: {str(e)}"
+            )
+
 
 if __name__ == "__main__":
     test_suite = TestLogging()